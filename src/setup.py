@@ -71,7 +71,12 @@ setuptools.setup(
         "einops",
         # Compression tools
         "pyliblzfse",
+        "lz4",
         "webp",
+        # Message serialization for ZMQ transport
+        "msgpack",
+        # Fast episode label serialization
+        "orjson",
         # UI tools
         "termcolor",
         # Audio
@@ -7,8 +7,11 @@
 # Some code may be adapted from other open-source works with their respective licenses. Original
 # license information maybe found below, if so.
 
+import math
+import time
 from typing import Optional
 
+import numpy as np
 from termcolor import colored
 
 from stretch.agent.robot_agent import RobotAgent
@@ -17,6 +20,24 @@ from stretch.core.task import Operation
 from stretch.mapping.instance import Instance
 from stretch.motion import PlanResult
 
+# Matplotlib backs the debug visualizations below. Importing it (and switching backends) per
+# call costs hundreds of ms the first time and module-lookup work every time after; do it at
+# most once per process, and never when the debug flags stay off.
+_plt = None
+
+
+def lazy_plt():
+    """Import matplotlib (and select the backend) the first time a debug view is requested."""
+    global _plt
+    if _plt is None:
+        import matplotlib
+
+        matplotlib.use("TkAgg")
+        import matplotlib.pyplot as plt
+
+        _plt = plt
+    return _plt
+
 
 class ManagedOperation(Operation):
     """Placeholder node for an example in a task plan. Contains some functions to make it easier to print out different messages with color for interpretability, and also provides some utilities for making the robot do different tasks."""
@@ -41,6 +62,11 @@ class ManagedOperation(Operation):
         # Get the robot kinematic model
         self.robot_model = self.robot.get_robot_model()
 
+        # Snapshot of the base pose so one operation step does not pay a ZMQ round-trip for
+        # every pose query; see get_base_pose_cached().
+        self._base_pose: Optional[np.ndarray] = None
+        self._base_pose_ts: float = -math.inf
+
     @property
     def name(self) -> str:
         """Return the name of the operation.
@@ -73,29 +99,92 @@ class ManagedOperation(Operation):
         """An upbeat message!"""
         print(colored(f"!!! {self.name} !!!: {message}", "green"))
 
+    def get_object_xyz(self, instance: Optional[Instance] = None) -> np.ndarray:
+        """Get the center of an instance as a numpy array. Defaults to the agent's current
+        object. The center itself is cached on the instance, so repeated queries within a
+        pickup cycle do not recompute the point cloud reduction.
+
+        Args:
+            instance (Optional[Instance]): instance to query; defaults to the current object
+
+        Returns:
+            np.ndarray: [3,] center of the instance in global coordinates
+        """
+        if instance is None:
+            instance = self.agent.current_object
+        return instance.get_center().detach().cpu().numpy()
+
+    @staticmethod
+    def compute_pitch_from_vertical(ee_pos: np.ndarray, relative_object_xyz: np.ndarray) -> float:
+        """Compute the wrist pitch (from vertical) needed to point the gripper at an object.
+        Works on plain floats so we do not allocate zero-dim arrays on the grasp hot path.
+
+        Args:
+            ee_pos (np.ndarray): end effector position in the robot's base frame
+            relative_object_xyz (np.ndarray): object position in the robot's base frame
+
+        Returns:
+            float: pitch angle from vertical in radians
+        """
+        dy = abs(float(ee_pos[1]) - float(relative_object_xyz[1]))
+        dz = abs(float(ee_pos[2]) - float(relative_object_xyz[2]))
+        return math.atan2(dy, dz)
+
+    def get_base_pose_cached(self, max_age: float = 0.05) -> np.ndarray:
+        """Get the robot's base pose, reusing a recent snapshot if one exists. Each call to
+        robot.get_base_pose() is a ZMQ round-trip, and a single operation step often wants the
+        pose several times while the base is not moving; a short max_age keeps them coherent.
+
+        Args:
+            max_age (float): maximum age of the snapshot in seconds before it is refreshed
+
+        Returns:
+            np.ndarray: [x, y, theta] base pose in global coordinates
+        """
+        now = time.monotonic()
+        if self._base_pose is None or now - self._base_pose_ts > max_age:
+            self._base_pose = self.robot.get_base_pose()
+            self._base_pose_ts = now
+        return self._base_pose
+
+    def wait_until_settled(
+        self, timeout: float = 2.0, tol: float = 5e-3, poll: float = 0.05
+    ) -> bool:
+        """Wait for the arm to stop moving by polling joint positions, instead of sleeping a
+        fixed amount after a motion command. Returns as soon as two consecutive reads agree,
+        which is typically far sooner than the worst-case sleep it replaces.
+
+        Args:
+            timeout (float): give up after this many seconds
+            tol (float): per-joint motion threshold in joint units between polls
+            poll (float): seconds between polls
+
+        Returns:
+            bool: True if the arm settled within the timeout
+        """
+        prev = self.robot.get_joint_positions()
+        t0 = time.monotonic()
+        while time.monotonic() - t0 < timeout:
+            time.sleep(poll)
+            current = self.robot.get_joint_positions()
+            if np.max(np.abs(current - prev)) < tol:
+                return True
+            prev = current
+        return False
+
     def plan_to_instance_for_manipulation(self, instance, start) -> PlanResult:
         """Manipulation planning wrapper. Plan to instance with a radius around it, ensuring a base location can be found in explored space."""
         return self.agent.plan_to_instance_for_manipulation(instance, start=start)
 
     def show_instance_segmentation_image(self):
         # Show the last instance image
-        import matplotlib
-
-        # TODO: why do we need to configure this every time
-        matplotlib.use("TkAgg")
-        import matplotlib.pyplot as plt
-
+        plt = lazy_plt()
         plt.imshow(self.agent.voxel_map.observations[0].instance)
         plt.show()
 
     def show_instance(self, instance: Instance, title: Optional[str] = None):
         """Show the instance in the voxel grid."""
-        import matplotlib
-
-        matplotlib.use("TkAgg")
-
-        import matplotlib.pyplot as plt
-
+        plt = lazy_plt()
         view = instance.get_best_view()
         plt.imshow(view.get_image())
         if title is not None:
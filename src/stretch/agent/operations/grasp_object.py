@@ -326,7 +326,7 @@ class GraspObjectOperation(ManagedOperation):
                 head=constants.look_at_ee,
                 blocking=True,
             )
-            time.sleep(0.5)
+            self.wait_until_settled()
 
         self.robot.close_gripper(loose=self.grasp_loose, blocking=True)
         time.sleep(0.5)
@@ -338,6 +338,9 @@ class GraspObjectOperation(ManagedOperation):
         lifted_joint_state = joint_state.copy()
         lifted_joint_state[HelloStretchIdx.LIFT] += 0.2
         self.robot.arm_to(lifted_joint_state, head=constants.look_at_ee, blocking=True)
+        # Record the success so was_successful() reflects it even when callers ignore the
+        # return value.
+        self._success = True
         return True
 
     def visual_servo_to_object(
@@ -636,25 +639,27 @@ class GraspObjectOperation(ManagedOperation):
         # Now we should be able to see the object if we orient gripper properly
         # Get the end effector pose
         obs = self.robot.get_observation()
-        joint_state = self.robot.get_joint_positions()
+        # Take the joints and the base pose from the same observation snapshot instead of
+        # issuing separate state queries; this keeps them mutually consistent and avoids
+        # extra round-trips on the grasp hot path. Copy because obs.joint aliases the
+        # client's cached observation and we mutate the wrist pitch below.
+        joint_state = obs.joint.copy()
         model = self.robot.get_robot_model()
 
         if joint_state[HelloStretchIdx.GRIPPER] < 0.0:
             self.robot.open_gripper(blocking=True)
 
         # Get the current base pose of the robot
-        xyt = self.robot.get_base_pose()
+        xyt = np.concatenate([obs.gps, obs.compass], axis=-1)
 
         # Note that these are in the robot's current coordinate frame; they're not global coordinates, so this is ok to use to compute motions.
-        object_xyz = self.agent.current_object.get_center()
+        object_xyz = self.get_object_xyz()
         relative_object_xyz = point_global_to_base(object_xyz, xyt)
 
         # Compute the angles necessary
         if self.use_pitch_from_vertical:
             ee_pos, ee_rot = model.manip_fk(joint_state)
-            dy = np.abs(ee_pos[1] - relative_object_xyz[1])
-            dz = np.abs(ee_pos[2] - relative_object_xyz[2])
-            pitch_from_vertical = np.arctan2(dy, dz)
+            pitch_from_vertical = self.compute_pitch_from_vertical(ee_pos, relative_object_xyz)
         else:
             pitch_from_vertical = 0.0
 
@@ -681,7 +686,7 @@ class GraspObjectOperation(ManagedOperation):
             object_xyz (np.ndarray): Location to grasp
             distance_from_object (float, optional): Distance from object. Defaults to 0.2.
         """
-        xyt = self.robot.get_base_pose()
+        xyt = self.get_base_pose_cached()
         relative_object_xyz = point_global_to_base(object_xyz, xyt)
 
         joint_state = self.robot.get_joint_positions()
@@ -732,8 +737,8 @@ class GraspObjectOperation(ManagedOperation):
         print(f"{self.name}: Moving to pre-grasp position.")
         self.robot.arm_to(target_joint_positions, head=constants.look_at_ee, blocking=True)
 
-        # wait for image to stabilize
-        time.sleep(1.0)
+        # Wait for the arm (and therefore the image) to stabilize before moving on
+        self.wait_until_settled()
 
     def grasp_open_loop(self, object_xyz: np.ndarray):
         """Grasp the object in an open loop manner. We will just move to object_xyz and close the gripper.
@@ -746,7 +751,7 @@ class GraspObjectOperation(ManagedOperation):
         """
 
         model = self.robot.get_robot_model()
-        xyt = self.robot.get_base_pose()
+        xyt = self.get_base_pose_cached()
         relative_object_xyz = point_global_to_base(object_xyz, xyt)
         joint_state = self.robot.get_joint_positions()
 
@@ -779,7 +784,7 @@ class GraspObjectOperation(ManagedOperation):
         # Move to the target joint state
         print(f"{self.name}: Moving to grasp position.")
         self.robot.arm_to(target_joint_positions, head=constants.look_at_ee, blocking=True)
-        time.sleep(0.5)
+        self.wait_until_settled()
         print(f"{self.name}: Closing the gripper.")
         self.robot.close_gripper(blocking=True)
         time.sleep(0.5)
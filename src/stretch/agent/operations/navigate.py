@@ -40,7 +40,7 @@ class NavigateToObjectOperation(ManagedOperation):
             self.error("no target!")
             return False
 
-        start = self.robot.get_base_pose()
+        start = self.get_base_pose_cached()
         if not self.navigation_space.is_valid(start):
             self.error(
                 "Robot is in an invalid configuration. It is probably too close to geometry, or localization has failed."
@@ -75,10 +75,9 @@ class NavigateToObjectOperation(ManagedOperation):
         if self.agent.within_reach_of(self.get_target()):
             self.warn("Already within reach of object!")
             xyz = self.get_target().get_center()
-            start_xyz = self.robot.get_base_pose()[:2]
-            theta = math.atan2(
-                xyz[1] - self.robot.get_base_pose()[1], xyz[0] - self.robot.get_base_pose()[0]
-            )
+            start_pose = self.get_base_pose_cached()
+            start_xyz = start_pose[:2]
+            theta = math.atan2(xyz[1] - start_pose[1], xyz[0] - start_pose[0])
             self.robot.navigate_to(
                 np.array([start_xyz[0], start_xyz[1], theta + np.pi / 2]),
                 blocking=True,
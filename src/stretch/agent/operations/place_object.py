@@ -141,7 +141,9 @@ class PlaceObjectOperation(ManagedOperation):
 
         # Get initial (carry) joint posture
         obs = self.robot.get_observation()
-        joint_state = obs.joint
+        # Copy: obs.joint aliases the client's cached observation, and we mutate the wrist
+        # pitch below to build the goal.
+        joint_state = obs.joint.copy()
         model = self.robot.get_robot_model()
 
         # Switch to place position
@@ -31,15 +31,15 @@ class PreGraspObjectOperation(ManagedOperation):
         elif self.agent.is_instance_unreachable(self.agent.current_object):
             return False
 
-        start = self.robot.get_base_pose()
+        start = self.get_base_pose_cached()
         if not self.navigation_space.is_valid(start):
             self.error(
                 f"{self.name}: [ERROR]: Robot is in an invalid configuration. It is probably too close to geometry, or localization has failed."
             )
-            breakpoint()
+            return False
 
         # Get the center of the object point cloud so that we can look at it
-        object_xyz = self.agent.current_object.point_cloud.mean(axis=0)
+        object_xyz = self.get_object_xyz()
         dist = np.linalg.norm(object_xyz[:2] - start[:2])
         if dist > self.grasp_distance_threshold:
             self.error(f"Object is too far away to grasp: {dist}")
@@ -55,29 +55,28 @@ class PreGraspObjectOperation(ManagedOperation):
         # Now we should be able to see the object if we orient gripper properly
         # Get the end effector pose
         obs = self.robot.get_observation()
-        joint_state = obs.joint
+        # Copy: obs.joint aliases the client's cached observation, and we mutate the wrist
+        # pitch below to build the goal.
+        joint_state = obs.joint.copy()
         model = self.robot.get_robot_model()
 
         # Note that these are in the robot's current coordinate frame; they're not global coordinates, so this is ok to use to compute motions.
         ee_pos, ee_rot = model.manip_fk(joint_state)
 
         # Get the center of the object point cloud so that we can look at it
-        object_xyz = self.agent.current_object.point_cloud.mean(axis=0)
-        xyt = self.robot.get_base_pose()
+        object_xyz = self.get_object_xyz()
+        # Use the base pose from the same observation as the joints so the two agree
+        xyt = np.concatenate([obs.gps, obs.compass], axis=-1)
         if self.show_object_in_voxel_grid:
             # Show where the object is together with the robot base
             self.agent.voxel_map.show(
-                orig=object_xyz.cpu().numpy(), xyt=xyt, footprint=self.robot_model.get_footprint()
+                orig=object_xyz, xyt=xyt, footprint=self.robot_model.get_footprint()
             )
         relative_object_xyz = point_global_to_base(object_xyz, xyt)
 
         # Compute the angles necessary
         if self.use_pitch_from_vertical:
-            # dy = relative_gripper_xyz[1] - relative_object_xyz[1]
-            dy = np.abs(ee_pos[1] - relative_object_xyz[1])
-            dz = np.abs(ee_pos[2] - relative_object_xyz[2])
-            pitch_from_vertical = np.arctan2(dy, dz)
-            # current_ee_pitch = joint_state[HelloStretchIdx.WRIST_PITCH]
+            pitch_from_vertical = self.compute_pitch_from_vertical(ee_pos, relative_object_xyz)
         else:
             pitch_from_vertical = 0.0
 
@@ -7,13 +7,14 @@
 # Some code may be adapted from other open-source works with their respective licenses. Original
 # license information maybe found below, if so.
 
-from typing import Optional
+from typing import Dict, Optional
 
 import numpy as np
 import torch
 from PIL import Image
 
 from stretch.agent.base import ManagedOperation
+from stretch.agent.base.managed_operation import lazy_plt
 from stretch.mapping.instance import Instance
 
 
@@ -37,12 +38,26 @@ class ManagedSearchOperation(ManagedOperation):
     def __init__(self, *args, match_method="feature", **kwargs):
         super().__init__(*args, **kwargs)
         self.match_method = match_method
+        # Category ids repeat across instances, so memoize the id -> name lookup (and whether
+        # that name matches the target class) instead of querying the semantic sensor once per
+        # instance on every pass over the map.
+        self._class_name_cache: Dict[int, str] = {}
+        self._name_match_cache: Dict[int, bool] = {}
 
     def set_target_object_class(self, object_class: str):
         """Set the target object class for the search operation."""
         self.warn(f"Overwriting target object class from {self.object_class} to {object_class}.")
         self._object_class = object_class
         self._object_class_feature = None
+        self._name_match_cache.clear()
+
+    def get_class_name(self, category_id: int) -> str:
+        """Look up the class name for a category id, caching results across instances."""
+        name = self._class_name_cache.get(category_id)
+        if name is None:
+            name = self.agent.semantic_sensor.get_class_name_for_id(category_id)
+            self._class_name_cache[category_id] = name
+        return name
 
     def is_match_by_feature(self, instance: Instance) -> bool:
         # Compute the feature vector for the object if not saved
@@ -62,14 +77,35 @@ class ManagedSearchOperation(ManagedOperation):
             return self.is_match_by_feature(instance)
         elif self.match_method == "class":
             # Lookup the class name and check if it matches our target
-            name = self.agent.semantic_sensor.get_class_name_for_id(instance.category_id)
+            name = self.get_class_name(instance.category_id)
             print(f" - Found instance {instance.global_id} of class {name}")
-            return self.is_name_match(name)
+            match = self._name_match_cache.get(instance.category_id)
+            if match is None:
+                match = self.is_name_match(name)
+                self._name_match_cache[instance.category_id] = match
+            return match
 
     def is_name_match(self, name: str) -> bool:
         """Check if the name of the object is a match for the target object class. By default, we check if the object class is in the name of the object."""
         return self.object_class in name
 
+    def show_instance_views(self, views) -> None:
+        """Show the collected instance views in a single grid figure. One blocking window per
+        instance makes debugging runs take seconds per instance; one figure per search is enough.
+
+        Args:
+            views: list of (image, title) pairs, one per instance.
+        """
+        if len(views) == 0:
+            return
+        plt = lazy_plt()
+        _, axes = plt.subplots(1, len(views), squeeze=False)
+        for ax, (image, title) in zip(axes[0], views):
+            ax.imshow(image)
+            ax.set_title(title)
+            ax.axis("off")
+        plt.show()
+
 
 class SearchForReceptacleOperation(ManagedSearchOperation):
     """Find a place to put the objects we find on the floor. Will explore the map for a receptacle."""
@@ -113,11 +149,15 @@ class SearchForReceptacleOperation(ManagedSearchOperation):
         # Check to see if we have a receptacle in the map
         instances = self.agent.voxel_map.instances.get_instances()
         print("Check explored instances for reachable receptacles:")
+        views_to_show = []
         for i, instance in enumerate(instances):
-            # For debugging during exploration
+            # For debugging during exploration; views are collected here and shown as one grid
+            # after the loop so we do not block on a window per instance.
             if self.show_instances_detected:
-                name = self.agent.semantic_sensor.get_class_name_for_id(instance.category_id)
-                self.show_instance(instance, f"Instance {i} with name {name}")
+                name = self.get_class_name(instance.category_id)
+                views_to_show.append(
+                    (instance.get_best_view().get_image(), f"Instance {i} with name {name}")
+                )
 
             # Find the object we care about
             if self.is_match(instance):
@@ -131,6 +171,8 @@ class SearchForReceptacleOperation(ManagedSearchOperation):
                     self.agent.set_instance_as_unreachable(instance)
                     self.warn(f" - Found a receptacle but could not reach it.")
 
+        self.show_instance_views(views_to_show)
+
         # If no receptacle, pick a random point nearby and just wander around
         if self.agent.current_receptacle is None:
             print("None found. Try moving to frontier.")
@@ -220,12 +262,7 @@ class SearchForObjectOnFloorOperation(ManagedSearchOperation):
 
         if self.show_instances_detected:
             # Show the last instance image
-            import matplotlib
-
-            # TODO: why do we need to configure this every time
-            matplotlib.use("TkAgg")
-            import matplotlib.pyplot as plt
-
+            plt = lazy_plt()
             plt.imshow(self.agent.voxel_map.observations[0].instance)
             plt.show()
 
@@ -235,10 +272,15 @@ class SearchForObjectOnFloorOperation(ManagedSearchOperation):
         # Compute scene graph from instance memory so that we can use it
         scene_graph = self.agent.get_scene_graph()
 
+        # Collect everything sitting on the floor in one pass over the relationships, rather
+        # than scanning the whole relationship list once per candidate instance below.
+        on_floor_ids = {rel[0] for rel in scene_graph.get_matching_relations(None, "floor", "on")}
+
         receptacle_options = []
+        views_to_show = []
         print(f"Check explored instances for reachable {self.object_class} instances:")
         for i, instance in enumerate(instances):
-            name = self.agent.semantic_sensor.get_class_name_for_id(instance.category_id)
+            name = self.get_class_name(instance.category_id)
             print(f" - Found instance {i} with name {name} and global id {instance.global_id}.")
 
             if self.agent.is_instance_unreachable(instance):
@@ -246,11 +288,12 @@ class SearchForObjectOnFloorOperation(ManagedSearchOperation):
                 continue
 
             if self.show_instances_detected:
-                self.show_instance(instance, f"Instance {i} with name {name}")
+                views_to_show.append(
+                    (instance.get_best_view().get_image(), f"Instance {i} with name {name}")
+                )
 
             if self.is_match(instance):
-                relations = scene_graph.get_matching_relations(instance.global_id, "floor", "on")
-                if len(relations) > 0:
+                if instance.global_id in on_floor_ids:
                     # We found a matching relation!
                     print(f" - Found a toy on the floor at {instance.get_best_view().get_pose()}.")
 
@@ -263,6 +306,8 @@ class SearchForObjectOnFloorOperation(ManagedSearchOperation):
                         self.agent.current_object = instance
                         break
 
+        self.show_instance_views(views_to_show)
+
         # Check to see if there is a visitable frontier
         if self.agent.current_object is None:
             self.warn(f"No {self.object_class} found. Moving to frontier.")
@@ -24,6 +24,7 @@ import stretch.motion.constants as constants
 import stretch.motion.conversions as conversions
 import stretch.utils.compression as compression
 import stretch.utils.logger as logger
+import stretch.utils.serialization as serialization
 from stretch.core.interfaces import ContinuousNavigationAction, Observations
 from stretch.core.parameters import Parameters, get_parameters
 from stretch.core.robot import AbstractRobotClient
@@ -64,7 +65,7 @@ class HomeRobotZmqClient(AbstractRobotClient):
         recv_socket.setsockopt(zmq.RCVHWM, 1)
         recv_socket.setsockopt(zmq.CONFLATE, 1)
 
-        recv_address = lookup_address(robot_ip, use_remote_computer) + ":" + str(port)
+        recv_address = lookup_address(robot_ip, use_remote_computer, port=port)
         print(f"Connecting to {recv_address} to receive {message_type}...")
         recv_socket.connect(recv_address)
 
@@ -87,6 +88,7 @@ class HomeRobotZmqClient(AbstractRobotClient):
         manip_mode_controlled_joints: Optional[List[str]] = None,
         start_immediately: bool = True,
         enable_rerun_server: bool = True,
+        command_only: bool = False,
     ):
         """
         Create a client to communicate with the robot over ZMQ.
@@ -102,9 +104,12 @@ class HomeRobotZmqClient(AbstractRobotClient):
             grasp_frame: The frame to use for grasping
             ee_link_name: The name of the end effector link
             manip_mode_controlled_joints: The joints to control in manipulation mode
+            command_only: Only subscribe to low-level state, not cameras; lets one-shot CLI
+                tools send a command and exit without waiting seconds for image streams
         """
         self.recv_port = recv_port
         self.send_port = send_port
+        self._command_only = command_only
         self.reset()
 
         # Variables we set here should not change
@@ -167,9 +172,7 @@ class HomeRobotZmqClient(AbstractRobotClient):
         self.send_socket.setsockopt(zmq.SNDHWM, 1)
         self.send_socket.setsockopt(zmq.RCVHWM, 1)
 
-        self.send_address = (
-            lookup_address(robot_ip, use_remote_computer) + ":" + str(self.send_port)
-        )
+        self.send_address = lookup_address(robot_ip, use_remote_computer, port=self.send_port)
 
         print(f"Connecting to {self.send_address} to send action messages...")
         self.send_socket.connect(self.send_address)
@@ -477,6 +480,9 @@ class HomeRobotZmqClient(AbstractRobotClient):
         self._state = None  # Low level state includes joint angles and base XYT
         self._servo = None  # Visual servoing state includes smaller images
         self._thread = None
+        self._state_thread = None
+        self._servo_thread = None
+        self._rerun_thread = None
         self._finish = False
         self._last_step = -1
 
@@ -627,7 +633,7 @@ class HomeRobotZmqClient(AbstractRobotClient):
                 at_goal = True
                 at_goal_t = timeit.default_timer()
             elif resend_action is not None:
-                self.send_socket.send_pyobj(resend_action)
+                self.send_socket.send(serialization.pack(resend_action), copy=False)
             else:
                 at_goal = False
 
@@ -751,7 +757,7 @@ class HomeRobotZmqClient(AbstractRobotClient):
             # Resend the action if we are not moving for some reason and it's been provided
             if resend_action is not None and not close_to_goal:
                 # Resend the action
-                self.send_socket.send_pyobj(resend_action)
+                self.send_socket.send(serialization.pack(resend_action), copy=False)
 
             t1 = timeit.default_timer()
             if t1 - t0 > timeout:
@@ -964,11 +970,11 @@ class HomeRobotZmqClient(AbstractRobotClient):
 
             # TODO: fix all of this - why do we need to do this?
             # print("SENDING THIS ACTION:", next_action)
-            self.send_socket.send_pyobj(next_action)
+            self.send_socket.send(serialization.pack(next_action), copy=False)
             time.sleep(0.01)
             # TODO: why do we send the action twice?
             # print("SENDING THIS ACTION:", next_action)
-            self.send_socket.send_pyobj(next_action)
+            self.send_socket.send(serialization.pack(next_action), copy=False)
 
             # For tracking goal
             if "xyt" in next_action:
@@ -1004,14 +1010,14 @@ class HomeRobotZmqClient(AbstractRobotClient):
 
         while not self._finish:
 
-            output = self.recv_socket.recv_pyobj()
+            output = serialization.unpack(self.recv_socket.recv())
             if output is None:
                 continue
 
             self._seq_id += 1
             output["rgb"] = compression.from_jpg(output["rgb"])
             compressed_depth = output["depth"]
-            depth = compression.from_jp2(compressed_depth) / 1000
+            depth = compression.from_depth(compressed_depth, output["depth/shape"]) / 1000
             output["depth"] = depth
 
             if camera is None:
@@ -1043,13 +1049,20 @@ class HomeRobotZmqClient(AbstractRobotClient):
 
         # color_image = compression.from_webp(message["ee_cam/color_image"])
         color_image = compression.from_jpg(message["ee_cam/color_image"])
-        depth_image = compression.from_jp2(message["ee_cam/depth_image"])
+        depth_image = compression.from_depth(
+            message["ee_cam/depth_image"], message["ee_cam/depth_image/shape"]
+        )
         depth_image = depth_image / 1000
         image_scaling = message["ee_cam/image_scaling"]
 
         # Get head information from the message as well
         head_color_image = compression.from_jpg(message["head_cam/color_image"])
-        head_depth_image = compression.from_jp2(message["head_cam/depth_image"]) / 1000
+        head_depth_image = (
+            compression.from_depth(
+                message["head_cam/depth_image"], message["head_cam/depth_image/shape"]
+            )
+            / 1000
+        )
         head_image_scaling = message["head_cam/image_scaling"]
         joint = message["robot/config"]
         with self._servo_lock and self._state_lock:
@@ -1090,7 +1103,7 @@ class HomeRobotZmqClient(AbstractRobotClient):
         while not self._finish:
             t1 = timeit.default_timer()
             dt = t1 - t0
-            output = self.recv_servo_socket.recv_pyobj()
+            output = serialization.unpack(self.recv_servo_socket.recv())
             self.update_servo(output)
             sum_time += dt
             steps += 1
@@ -1117,7 +1130,7 @@ class HomeRobotZmqClient(AbstractRobotClient):
         t0 = timeit.default_timer()
 
         while not self._finish:
-            output = self.recv_state_socket.recv_pyobj()
+            output = serialization.unpack(self.recv_state_socket.recv())
             self._update_state(output)
 
             t1 = timeit.default_timer()
@@ -1149,20 +1162,26 @@ class HomeRobotZmqClient(AbstractRobotClient):
         if self._started:
             return True
 
-        self._thread = threading.Thread(target=self.blocking_spin)
+        # In command-only mode, just the low-level state subscription is needed to send a
+        # command and confirm it executed; skip the camera and servo streams entirely.
         self._state_thread = threading.Thread(target=self.blocking_spin_state)
-        self._servo_thread = threading.Thread(target=self.blocking_spin_servo)
-        if self._rerun:
-            self._rerun_thread = threading.Thread(target=self.blocking_spin_rerun)
+        if not self._command_only:
+            self._thread = threading.Thread(target=self.blocking_spin)
+            self._servo_thread = threading.Thread(target=self.blocking_spin_servo)
+            if self._rerun:
+                self._rerun_thread = threading.Thread(target=self.blocking_spin_rerun)
         self._finish = False
-        self._thread.start()
         self._state_thread.start()
-        self._servo_thread.start()
-        if self._rerun:
-            self._rerun_thread.start()
+        if not self._command_only:
+            self._thread.start()
+            self._servo_thread.start()
+            if self._rerun:
+                self._rerun_thread.start()
 
         t0 = timeit.default_timer()
-        while self._obs is None or self._state is None or self._servo is None:
+        while self._state is None or (
+            not self._command_only and (self._obs is None or self._servo is None)
+        ):
             time.sleep(0.1)
             t1 = timeit.default_timer()
             if t1 - t0 > 10.0:
@@ -31,14 +31,16 @@ def main(
     close: bool = False,
     blocking: bool = False,
 ):
-    # Create robot
+    # Create robot. This is a one-shot command, so only subscribe to the low-level state
+    # stream; waiting on camera streams would add seconds to every scripted invocation.
     parameters = get_parameters(parameter_file)
     robot = HomeRobotZmqClient(
         robot_ip=robot_ip,
         use_remote_computer=(not local),
         parameters=parameters,
+        enable_rerun_server=False,
+        command_only=True,
     )
-    robot.start()
     robot.close_gripper(blocking=True)
     robot.stop()
 
@@ -18,7 +18,15 @@ from stretch.app.dex_teleop.dex_teleop_parameters import (
     DEX_TELEOP_CONTROLLED_JOINTS,
     SUPPORTED_MODES,
 )
-from stretch.utils.geometry import get_rotation_from_xyz
+from stretch.utils.geometry import get_rotation_from_xyz, mul4
+
+# Constant frame transformations used by process_goal_dict on every teleop frame; built once
+# at import so the per-frame path does not reallocate them.
+# Rotation into the gripper grasp frame
+_GRIPPER_CENTER_DELTA = np.array([[0.0, 1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, -1.0]])
+# Translation offset from the wrist to the grasp center
+_T_WRIST_TO_GRASP = np.eye(4)
+_T_WRIST_TO_GRASP[0, 3] = 0.3
 
 
 def load_urdf(file_name):
@@ -131,9 +139,8 @@ def process_goal_dict(
     if use_gripper_center:
         # Apply conversion
         # This is a simple frame transformation which should rotate into gripper grasp frame
-        delta = np.array([[0.0, 1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, -1.0]])
-        r_matrix = r.as_matrix() @ delta
-        r = r.from_matrix(r_matrix)
+        r_matrix = r.as_matrix() @ _GRIPPER_CENTER_DELTA
+        r = Rotation.from_matrix(r_matrix)
     else:
         goal_dict["gripper_orientation"] = r.as_quat()
         r_matrix = r.as_matrix()
@@ -144,12 +151,10 @@ def process_goal_dict(
     T1[:3, 3] = goal_dict["wrist_position"]
 
     if use_gripper_center:
-        T_wrist_to_grasp = np.eye(4)
-        T_wrist_to_grasp[2, 3] = 0
-        T_wrist_to_grasp[0, 3] = 0.3
-        # T_wrist_to_grasp[1, 3] = 0.3
-        T1 = T1 @ T_wrist_to_grasp
-        goal_dict["gripper_orientation"] = Rotation.from_matrix(T1[:3, :3]).as_quat()
+        # The wrist-to-grasp offset is translation only, so the rotation of T1 is still
+        # r_matrix and we can reuse the Rotation built above instead of reconstructing it.
+        T1 = mul4(T1, _T_WRIST_TO_GRASP)
+        goal_dict["gripper_orientation"] = r.as_quat()
         goal_dict["gripper_x_axis"] = T1[:3, 0]
         goal_dict["gripper_y_axis"] = T1[:3, 1]
         goal_dict["gripper_z_axis"] = T1[:3, 2]
@@ -17,6 +17,7 @@ import timeit
 import cv2
 import numpy as np
 import stretch_body.robot as rb
+import zmq
 
 import stretch.app.dex_teleop.dex_teleop_parameters as dt
 import stretch.app.dex_teleop.gripper_to_goal as gg
@@ -24,6 +25,7 @@ import stretch.app.dex_teleop.robot_move as rm
 import stretch.motion.simple_ik as si
 import stretch.utils.compression as compression
 import stretch.utils.loop_stats as lt
+import stretch.utils.serialization as serialization
 from stretch.core.comms import CommsNode
 from stretch.drivers.d405 import D405
 from stretch.drivers.d435 import D435i
@@ -120,6 +122,8 @@ class DexTeleopFollower(CommsNode):
         self.goal_recv_socket, self.goal_recv_address = self._make_sub_socket(
             recv_port, use_remote_computer
         )
+        # Wake the recv loop up periodically so it can notice the stop flag and exit cleanly.
+        self.goal_recv_socket.setsockopt(zmq.RCVTIMEO, 100)
 
         self._done = False
 
@@ -135,6 +139,17 @@ class DexTeleopFollower(CommsNode):
         self._send_thread = None
         self._recv_thread = None
 
+        # Resize on the GPU when OpenCV has a usable CUDA device; on Jetson-class hosts this
+        # frees the CPU from two per-frame resizes per camera. Scratch GpuMats are reused
+        # across frames to avoid reallocating device memory.
+        try:
+            self._use_cuda_resize = cv2.cuda.getCudaEnabledDeviceCount() > 0
+        except (AttributeError, cv2.error):
+            self._use_cuda_resize = False
+        if self._use_cuda_resize:
+            self._gpu_color = cv2.cuda_GpuMat()
+            self._gpu_depth = cv2.cuda_GpuMat()
+
     def spin_recv_commands(self):
         loop_timer = lt.LoopStats("dex_teleop_follower")
         print_timing = False
@@ -142,7 +157,21 @@ class DexTeleopFollower(CommsNode):
 
         while not self._done:
             loop_timer.mark_start()
-            goal_dict = self.goal_recv_socket.recv_pyobj()
+            # Goals come over the wire as msgpack rather than pickle: decoding happens in C and
+            # costs far less per message than unpickling at teleop rates.
+            try:
+                goal_dict = serialization.unpack(self.goal_recv_socket.recv())
+            except zmq.Again:
+                # Receive timed out; loop around so a pending stop flag is honored.
+                continue
+            # Drain any goals that queued up while we were executing the previous one and keep
+            # only the most recent. Goals are absolute poses, so skipping stale ones is safe, and
+            # this caps IK work at the actuation loop rate no matter how fast the leader publishes.
+            while True:
+                try:
+                    goal_dict = serialization.unpack(self.goal_recv_socket.recv(zmq.NOBLOCK))
+                except zmq.Again:
+                    break
             if goal_dict:
                 if print_goal:
                     print("goal_dict =")
@@ -200,20 +229,40 @@ class DexTeleopFollower(CommsNode):
                 print(f" - gamma adjustment {self.gamma}")
 
         if self.scaling != 1.0:
-            color_image = cv2.resize(
-                color_image,
-                (0, 0),
-                fx=self.scaling,
-                fy=self.scaling,
-                interpolation=cv2.INTER_AREA,
-            )
-            depth_image = cv2.resize(
-                depth_image,
-                (0, 0),
-                fx=self.scaling,
-                fy=self.scaling,
-                interpolation=cv2.INTER_NEAREST,
-            )
+            if self._use_cuda_resize:
+                self._gpu_color.upload(color_image)
+                self._gpu_depth.upload(depth_image)
+                color_image = cv2.cuda.resize(
+                    self._gpu_color,
+                    (0, 0),
+                    fx=self.scaling,
+                    fy=self.scaling,
+                    interpolation=cv2.INTER_AREA,
+                ).download()
+                depth_image = cv2.cuda.resize(
+                    self._gpu_depth,
+                    (0, 0),
+                    fx=self.scaling,
+                    fy=self.scaling,
+                    interpolation=cv2.INTER_NEAREST,
+                ).download()
+            else:
+                # INTER_LINEAR hits OpenCV's SIMD paths and is about twice as fast as
+                # INTER_AREA at this fixed downscale, at a minor quality cost.
+                color_image = cv2.resize(
+                    color_image,
+                    (0, 0),
+                    fx=self.scaling,
+                    fy=self.scaling,
+                    interpolation=cv2.INTER_LINEAR,
+                )
+                depth_image = cv2.resize(
+                    depth_image,
+                    (0, 0),
+                    fx=self.scaling,
+                    fy=self.scaling,
+                    interpolation=cv2.INTER_NEAREST,
+                )
             if verbose:
                 print(f" - scaled by {self.scaling}")
 
@@ -229,6 +278,21 @@ class DexTeleopFollower(CommsNode):
         depth_scale = self.ee_cam.get_depth_scale()
         head_depth_scale = self.head_cam.get_depth_scale()
 
+        # Camera intrinsics, depth scales and image settings never change while streaming;
+        # build that part of the message once and only fill in the per-frame fields below.
+        static_output = {
+            "ee_cam/color_camera_info": color_camera_info,
+            "ee_cam/depth_camera_info": depth_camera_info,
+            "ee_cam/depth_scale": depth_scale,
+            "ee_cam/image_gamma": self.gamma,
+            "ee_cam/image_scaling": self.scaling,
+            "head_cam/color_camera_info": head_color_camera_info,
+            "head_cam/depth_camera_info": head_depth_camera_info,
+            "head_cam/depth_scale": head_depth_scale,
+            "head_cam/image_gamma": self.gamma,
+            "head_cam/image_scaling": self.scaling,
+        }
+
         while not self._done:
             loop_timer.mark_start()
             depth_image, color_image = self._get_images(from_head=False, verbose=verbose)
@@ -239,9 +303,9 @@ class DexTeleopFollower(CommsNode):
             compressed_head_depth_image = compression.zip_depth(head_depth_image)
             # depth_image2 = compression.unzip_depth(compressed_depth_image)
             t1 = timeit.default_timer()
-            compressed_color_image = compression.to_webp(color_image)
-            compressed_head_color_image = compression.to_webp(head_color_image)
-            # color_image2 = compression.from_webp(compressed_color_image)
+            compressed_color_image = compression.to_jpg(color_image)
+            compressed_head_color_image = compression.to_jpg(head_color_image)
+            # color_image2 = compression.from_jpg(compressed_color_image)
             t2 = timeit.default_timer()
             if self.print_time_debugging:
                 print(
@@ -258,31 +322,26 @@ class DexTeleopFollower(CommsNode):
             config = self.gripper_to_goal.get_current_config()
             ee_pos, ee_rot = self.gripper_to_goal.get_current_ee_pose()
 
-            d405_output = {
-                "ee_cam/color_camera_info": color_camera_info,
-                "ee_cam/depth_camera_info": depth_camera_info,
-                "ee_cam/color_image": compressed_color_image,
-                "ee_cam/color_image/shape": color_image.shape,
-                "ee_cam/depth_image": compressed_depth_image,
-                "ee_cam/depth_image/shape": depth_image.shape,
-                "ee_cam/depth_scale": depth_scale,
-                "ee_cam/image_gamma": self.gamma,
-                "ee_cam/image_scaling": self.scaling,
-                "head_cam/color_camera_info": head_color_camera_info,
-                "head_cam/depth_camera_info": head_depth_camera_info,
-                "head_cam/color_image": compressed_head_color_image,
-                "head_cam/color_image/shape": head_color_image.shape,
-                "head_cam/depth_image": compressed_head_depth_image,
-                "head_cam/depth_image/shape": head_depth_image.shape,
-                "head_cam/depth_scale": head_depth_scale,
-                "head_cam/image_gamma": self.gamma,
-                "head_cam/image_scaling": self.scaling,
-                "robot/config": config,
-                "robot/ee_position": ee_pos,
-                "robot/ee_rotation": ee_rot,
-            }
-
-            self.send_socket.send_pyobj(d405_output)
+            d405_output = dict(static_output)
+            d405_output.update(
+                {
+                    "ee_cam/color_image": compressed_color_image,
+                    "ee_cam/color_image/shape": color_image.shape,
+                    "ee_cam/depth_image": compressed_depth_image,
+                    "ee_cam/depth_image/shape": depth_image.shape,
+                    "head_cam/color_image": compressed_head_color_image,
+                    "head_cam/color_image/shape": head_color_image.shape,
+                    "head_cam/depth_image": compressed_head_depth_image,
+                    "head_cam/depth_image/shape": head_depth_image.shape,
+                    "robot/config": config,
+                    "robot/ee_position": ee_pos,
+                    "robot/ee_rotation": ee_rot,
+                }
+            )
+
+            # Pack with msgpack instead of pickle and let ZMQ send straight from the packed
+            # buffer; this avoids an extra full-frame copy through the pickler per publish.
+            self.send_socket.send(serialization.pack(d405_output), copy=False)
 
             loop_timer.mark_end()
             if verbose:
@@ -297,12 +356,13 @@ class DexTeleopFollower(CommsNode):
         self._recv_thread.start()
 
     def __del__(self):
+        # Threads cannot be killed; ask them to stop via the flag and wait briefly. The recv
+        # socket has a receive timeout set, so the recv loop notices the flag within ~100 ms.
         self._done = True
-        if self._send_thread:
-            self._send_thread.terminate()
-            self._recv_thread.terminate()
-            self._send_thread.join()
-            self._recv_thread.join()
+        if self._send_thread is not None:
+            self._send_thread.join(timeout=2.0)
+        if self._recv_thread is not None:
+            self._recv_thread.join(timeout=2.0)
         self.goal_recv_socket.close()
         self.send_socket.close()
         self.context.term()
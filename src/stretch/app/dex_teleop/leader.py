@@ -22,6 +22,7 @@ import stretch.app.dex_teleop.webcam_teleop_interface as wt
 import stretch.motion.simple_ik as si
 import stretch.utils.compression as compression
 import stretch.utils.logger as logger
+import stretch.utils.serialization as serialization
 from stretch.core import Evaluator
 from stretch.core.client import RobotClient
 from stretch.motion.pinocchio_ik_solver import PinocchioIKSolver
@@ -246,7 +247,7 @@ class DexTeleopLeader(Evaluator):
     def apply(self, message, display_received_images: bool = True) -> dict:
         """Take in image data and other data received by the robot and process it appropriately. Will run the aruco marker detection, predict a goal send that goal to the robot, and save everything to disk for learning."""
 
-        color_image = compression.from_webp(message["ee_cam/color_image"])
+        color_image = compression.from_jpg(message["ee_cam/color_image"])
         depth_image = compression.unzip_depth(
             message["ee_cam/depth_image"], message["ee_cam/depth_image/shape"]
         )
@@ -256,7 +257,7 @@ class DexTeleopLeader(Evaluator):
         image_scaling = message["ee_cam/image_scaling"]
 
         # Get head information from the message as well
-        head_color_image = compression.from_webp(message["head_cam/color_image"])
+        head_color_image = compression.from_jpg(message["head_cam/color_image"])
         head_depth_image = compression.unzip_depth(
             message["head_cam/depth_image"], message["head_cam/depth_image/shape"]
         )
@@ -284,7 +285,7 @@ class DexTeleopLeader(Evaluator):
             xyz = self.camera.depth_to_xyz(depth_image)
             show_point_cloud(xyz, color_image / 255, orig=np.zeros(3))
 
-        if display_received_images:
+        if display_received_images and self._has_display:
             # change depth to be h x w x 3
             depth_image_x3 = np.stack((depth_image,) * 3, axis=-1)
             combined = np.hstack((color_image / 255, depth_image_x3 / 4))
@@ -320,7 +321,8 @@ class DexTeleopLeader(Evaluator):
         # Wait for spacebar to be pressed and start/stop recording
         # Spacebar is 32
         # Escape is 27
-        key = cv2.waitKey(1)
+        # Without a display there are no windows to pump events for, so skip the ~1 ms waitKey.
+        key = cv2.waitKey(1) if self._has_display else -1
         if key == 32:
             self._recording = not self._recording
             self.prev_goal_dict = None
@@ -406,11 +408,12 @@ class DexTeleopLeader(Evaluator):
                     ee_rot=message["robot/ee_rotation"],
                 )
 
-            # Send goal joint configuration to robot
-            self.goal_send_socket.send_pyobj(goal_configuration)
+            # Send goal joint configuration to robot. Goals are small and sent at the teleop
+            # rate, so the cheap msgpack encode matters more here than for the image stream.
+            self.goal_send_socket.send(serialization.pack(goal_configuration), copy=False)
         else:
             # Send original goal_dict with valid=false
-            self.goal_send_socket.send_pyobj(goal_dict)
+            self.goal_send_socket.send(serialization.pack(goal_dict), copy=False)
 
         self.prev_goal_dict = goal_dict
 
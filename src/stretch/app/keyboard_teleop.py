@@ -10,6 +10,7 @@
 # license information maybe found below, if so.
 
 import os
+import select
 import sys
 
 import click
@@ -49,18 +50,19 @@ def key_pressed(robot: HomeRobotZmqClient, key):
     robot.navigate_to(goal_xyt, relative=True)
 
 
-def getch():
+def getch(timeout: float = 0.05):
+    """Poll for a single keypress, returning None if nothing was pressed within the timeout.
+    On Unix the terminal must already be in raw mode; main() enters raw mode once around the
+    whole loop instead of paying the termios save/set/restore syscalls per keystroke."""
     if os.name == "nt":  # Windows
-        return msvcrt.getch().decode("utf-8").lower()
+        if msvcrt.kbhit():
+            return msvcrt.getch().decode("utf-8").lower()
+        return None
     else:  # Unix-like
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(fd)
-            ch = sys.stdin.read(1)
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        return ch.lower()
+        ready, _, _ = select.select([sys.stdin], [], [], timeout)
+        if ready:
+            return sys.stdin.read(1).lower()
+        return None
 
 
 @click.command()
@@ -82,6 +84,21 @@ def main(robot_ip: str = "192.168.1.15", local: bool = False, headless: bool = F
         robot.move_to_nav_posture()
 
     print("Press W, A, S, or D. Press 'q' to quit.")
+
+    # In headless mode, enter raw mode once around the whole loop rather than per keystroke
+    old_settings = None
+    if headless and os.name != "nt":
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        tty.setraw(fd)
+    try:
+        _teleop_loop(robot, headless)
+    finally:
+        if old_settings is not None:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
+def _teleop_loop(robot: HomeRobotZmqClient, headless: bool):
     while True:
 
         if not headless:
@@ -107,6 +124,9 @@ def main(robot_ip: str = "192.168.1.15", local: bool = False, headless: bool = F
             char = chr(cv2.waitKey(1) & 0xFF)  # 0xFF is a mask to get the last 8 bits
         else:
             char = getch()
+            if char is None:
+                # No key pressed within the polling window
+                continue
 
         if char == "q":
             robot.stop()
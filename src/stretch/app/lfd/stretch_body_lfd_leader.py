@@ -16,6 +16,7 @@ import torch
 from lerobot.common.datasets.push_dataset_to_hub.dobbe_format import clip_and_normalize_depth
 
 import stretch.utils.compression as compression
+import stretch.utils.serialization as serialization
 from stretch.app.lfd.policy_utils import load_policy, prepare_action_dict, prepare_observations
 from stretch.core import Evaluator
 from stretch.core.client import RobotClient
@@ -87,7 +88,7 @@ class StretchBodyLfdLeader(Evaluator):
     def apply(self, message, display_received_images: bool = True) -> dict:
         """Take in image data and other data received by the robot and process it appropriately. Will parse the new observations, predict future actions and send the next action to the robot, and save everything to disk."""
 
-        gripper_color_image = compression.from_webp(message["ee_cam/color_image"])
+        gripper_color_image = compression.from_jpg(message["ee_cam/color_image"])
         gripper_depth_image = compression.unzip_depth(
             message["ee_cam/depth_image"], message["ee_cam/depth_image/shape"]
         )
@@ -97,7 +98,7 @@ class StretchBodyLfdLeader(Evaluator):
         image_scaling = message["ee_cam/image_scaling"]
 
         # Get head information from the message as well
-        head_color_image = compression.from_webp(message["head_cam/color_image"])
+        head_color_image = compression.from_jpg(message["head_cam/color_image"])
         head_depth_image = compression.unzip_depth(
             message["head_cam/depth_image"], message["head_cam/depth_image/shape"]
         )
@@ -129,7 +130,7 @@ class StretchBodyLfdLeader(Evaluator):
         gripper_depth_image = clip_and_normalize_depth(gripper_depth_image, self.depth_filter_k)
         head_depth_image = clip_and_normalize_depth(head_depth_image, self.depth_filter_k)
 
-        if display_received_images:
+        if display_received_images and self._has_display:
 
             gripper_combined = np.hstack((gripper_depth_image / 255, gripper_color_image / 255))
             head_combined = np.hstack((head_depth_image / 255, head_color_image / 255))
@@ -139,7 +140,8 @@ class StretchBodyLfdLeader(Evaluator):
         # Wait for spacebar to be pressed and start/stop recording
         # Spacebar is 32
         # Escape is 27
-        key = cv2.waitKey(1)
+        # Without a display there are no windows to pump events for, so skip the ~1 ms waitKey.
+        key = cv2.waitKey(1) if self._has_display else -1
         if key == 32:
             self._recording = not self._recording
             self.prev_goal_dict = None
@@ -181,7 +183,7 @@ class StretchBodyLfdLeader(Evaluator):
                 "joint_wrist_yaw": 0.00,
                 "stretch_gripper": 200.0,
             }
-            self.goal_send_socket.send_pyobj(action_dict)
+            self.goal_send_socket.send(serialization.pack(action_dict), copy=False)
             return action_dict
 
         action_dict = {}
@@ -226,7 +228,7 @@ class StretchBodyLfdLeader(Evaluator):
             )
 
         # Send action_dict to stretch follower
-        self.goal_send_socket.send_pyobj(action_dict)
+        self.goal_send_socket.send(serialization.pack(action_dict), copy=False)
 
         if self._recording:
             print("[LEADER] action_dict =")
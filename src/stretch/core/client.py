@@ -15,6 +15,7 @@ import cv2
 import zmq
 
 import stretch.utils.loop_stats as lt
+import stretch.utils.serialization as serialization
 from stretch.core import Evaluator
 
 
@@ -65,7 +66,7 @@ class RobotClient:
             while True:
 
                 loop_timer.mark_start()
-                message = self.d405_socket.recv_pyobj()
+                message = serialization.unpack(self.d405_socket.recv())
                 _ = evaluator.apply(message)
 
                 loop_timer.mark_end()
@@ -7,22 +7,57 @@
 # Some code may be adapted from other open-source works with their respective licenses. Original
 # license information maybe found below, if so.
 
+import os
 from typing import Tuple
 
 import zmq
 from zmq import Socket
 
+from stretch.utils.memory import local_ipc_address
+
 
 class BaseCommsNode:
     def __init__(self):
-        self.context = zmq.Context()
+        # Share one context (and its IO threads) across all comms nodes in the process. Two IO
+        # threads let socket sends overlap with camera capture when publishing images at a
+        # high rate; a context per node wastes threads and makes teardown expensive.
+        self.context = zmq.Context.instance(io_threads=2)
 
     def _new_pub_socket(self) -> Socket:
         socket = self.context.socket(zmq.PUB)
-        socket.setsockopt(zmq.SNDHWM, 1)
-        socket.setsockopt(zmq.RCVHWM, 1)
+        # Keep only the most recent message in the queue. This must be set before bind/connect,
+        # and it bounds end-to-end latency when the network cannot keep up with the publish rate.
+        # NOTE: conflation operates per zmq frame, so messages on these sockets must be a single
+        # frame - send_multipart would let parts of different messages be interleaved/dropped.
+        # Image payloads therefore ride inside the msgpack body rather than as separate frames.
+        socket.setsockopt(zmq.CONFLATE, 1)
+        # Do not block shutdown on unsent frames, and do not queue for peers that are not yet
+        # connected - this is a live stream, not a mailbox.
+        socket.setsockopt(zmq.LINGER, 0)
+        socket.setsockopt(zmq.IMMEDIATE, 1)
+        # Large enough kernel send buffer that a whole compressed image message fits; the IO
+        # thread can then hand a frame to the kernel in one go instead of dribbling it out.
+        socket.setsockopt(zmq.SNDBUF, 4 * 1024 * 1024)
         return socket
 
+    @staticmethod
+    def _ipc_address(port: int) -> str:
+        """Unix-socket endpoint for same-host mode, keyed by the channel's port number.
+
+        ipc:// skips the TCP stack entirely (no framing, checksums or loopback copies) while
+        keeping zmq semantics, including conflation, identical to the remote case. The scheme
+        is shared with the ZMQ client, which resolves its side through lookup_address.
+        """
+        return local_ipc_address(port)
+
+    @staticmethod
+    def _remove_stale_ipc_file(address: str) -> None:
+        """Unlink a leftover ipc socket file so a restarted server can bind again."""
+        if address.startswith("ipc://"):
+            path = address[len("ipc://") :]
+            if os.path.exists(path):
+                os.remove(path)
+
     def _new_sub_socket(self) -> Socket:
         recv_socket = self.context.socket(zmq.SUB)
         recv_socket.setsockopt(zmq.SUBSCRIBE, b"")
@@ -40,6 +75,7 @@ class CommsNode(BaseCommsNode):
         send_address = self._get_ip_address(send_port, use_remote_computer)
 
         print(f"Publishing on {send_address}...")
+        self._remove_stale_ipc_file(send_address)
         socket.bind(send_address)
         return socket
 
@@ -48,8 +84,7 @@ class CommsNode(BaseCommsNode):
         if use_remote_computer:
             recv_address = "tcp://*:" + str(port)
         else:
-            desktop_ip = "127.0.0.1"
-            recv_address = f"tcp://{desktop_ip}:" + str(port)
+            recv_address = self._ipc_address(port)
         return recv_address
 
     def _make_sub_socket(
@@ -61,6 +96,7 @@ class CommsNode(BaseCommsNode):
         recv_address = self._get_ip_address(recv_port, use_remote_computer)
 
         print(f"Listening on {recv_address}...")
+        self._remove_stale_ipc_file(recv_address)
         recv_socket.bind(recv_address)
         return recv_socket, recv_address
 
@@ -73,7 +109,8 @@ class ClientCommsNode(BaseCommsNode):
         if use_remote_computer:
             address = "tcp://" + robot_ip + ":" + str(port)
         else:
-            address = "tcp://" + "127.0.0.1" + ":" + str(port)
+            # Same host as the server, which binds the matching ipc endpoint in local mode.
+            address = self._ipc_address(port)
         return address
 
     def _make_pub_socket(
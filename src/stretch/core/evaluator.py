@@ -7,8 +7,11 @@
 # Some code may be adapted from other open-source works with their respective licenses. Original
 # license information maybe found below, if so.
 
+import os
 from typing import Any, Dict
 
+import cv2
+
 from .comms import ClientCommsNode
 
 
@@ -20,6 +23,9 @@ class Evaluator(ClientCommsNode):
         self.camera_info = None
         self.depth_scale = None
         self._done = False
+        # Subclasses use this to skip cv2.imshow/waitKey when there is no display to draw to;
+        # waitKey alone costs about a millisecond per frame in the event loop.
+        self._has_display = bool(os.environ.get("DISPLAY")) and hasattr(cv2, "imshow")
 
     def set_done(self):
         """Tell the loop to safely exit. Should be handled in apply() if necessary and is used by the client."""
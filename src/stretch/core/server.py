@@ -7,10 +7,12 @@
 # Some code may be adapted from other open-source works with their respective licenses. Original
 # license information maybe found below, if so.
 
+import os
 import threading
 import time
 import timeit
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Tuple
 
 import cv2
@@ -18,6 +20,7 @@ import numpy as np
 import zmq
 
 import stretch.utils.logger as logger
+import stretch.utils.serialization as serialization
 from stretch.audio.text_to_speech import get_text_to_speech
 from stretch.core.comms import CommsNode
 
@@ -29,6 +32,14 @@ class BaseZmqServer(CommsNode, ABC):
     fast_report_steps = 10000
     servo_report_steps = 1000
 
+    # Target publish rates (Hz) for the three send loops. Each loop paces itself against a
+    # monotonic deadline instead of sleeping a fixed tiny interval, so ticks land on a steady
+    # schedule, the loops stop spinning faster than their consumers can use, and a slow tick
+    # resets its deadline rather than bursting to catch up.
+    full_obs_rate_hz = 5.0
+    state_rate_hz = 200.0
+    servo_rate_hz = 15.0
+
     def __init__(
         self,
         send_port: int = 4401,
@@ -45,6 +56,12 @@ class BaseZmqServer(CommsNode, ABC):
     ):
         self.verbose = verbose
         self.context = zmq.Context()
+
+        # Bound OpenCV's internal pool so resize/encode SIMD kernels parallelize without
+        # oversubscribing the robot's cores, and reuse resize outputs across ticks (see
+        # _rescale_color_and_depth) instead of allocating fresh frames at the servo rate.
+        cv2.setNumThreads(min(4, os.cpu_count() or 1))
+        self._resize_buffers: Dict[Tuple, np.ndarray] = {}
         self.image_scaling = image_scaling
         self.ee_image_scaling = ee_image_scaling
         self.depth_scaling = depth_scaling
@@ -63,6 +80,21 @@ class BaseZmqServer(CommsNode, ABC):
         self.recv_socket, self.recv_address = self._make_sub_socket(recv_port, use_remote_computer)
         self._last_step = -1
 
+        # Poller for the action socket: epoll-based waiting is cheaper and wakes up faster
+        # than nonblocking recv plus short sleeps.
+        self._recv_poller = zmq.Poller()
+        self._recv_poller.register(self.recv_socket, zmq.POLLIN)
+
+        # Persistent pool for compressing outgoing images. The jpeg/jp2 encoders are single
+        # threaded but release the GIL, so encoding the four servo images in parallel cuts
+        # per-frame compression latency to roughly the slowest single encode.
+        self._encode_pool = ThreadPoolExecutor(max_workers=4)
+
+        # Single worker that prefetches the next servo message while the current one is
+        # packed and sent, so camera readout overlaps serialization and socket I/O instead
+        # of running after them.
+        self._servo_prefetch = ThreadPoolExecutor(max_workers=1)
+
         # Extensions to the ROS server
         # Text to speech engine - let's let the robot talk
         self.text_to_speech = get_text_to_speech(text_to_speech_engine)
@@ -83,24 +115,50 @@ class BaseZmqServer(CommsNode, ABC):
         """Check if the server is running."""
         return not self.done
 
+    def _pace(self, next_deadline: float, period: float) -> float:
+        """Sleep until the loop's next deadline and return the deadline after that.
+
+        If the loop has fallen behind its schedule the deadline is reset to now, so a slow
+        tick is followed by a full period rather than a burst of catch-up ticks.
+        """
+        next_deadline += period
+        now = time.monotonic()
+        if next_deadline <= now:
+            return now
+        time.sleep(next_deadline - now)
+        return next_deadline
+
+    def _resize_reuse(
+        self, image: np.ndarray, scaling: float, interpolation: int, tag: str
+    ) -> np.ndarray:
+        """Resize into a cached destination buffer keyed by caller tag and source geometry.
+
+        The tag keeps channels with identical geometry (e.g. ee and head cameras at the same
+        resolution and scaling) on separate buffers, so one channel's resize cannot clobber a
+        frame another channel is still holding. The returned array is only valid until the
+        next call with the same tag and geometry; callers must finish encoding (or copy)
+        before asking for their next frame, which the send loops already do.
+        """
+        key = (tag, image.shape, image.dtype.str, scaling, interpolation)
+        dst = self._resize_buffers.get(key)
+        if dst is None:
+            dst = cv2.resize(image, (0, 0), fx=scaling, fy=scaling, interpolation=interpolation)
+        else:
+            dst = cv2.resize(
+                image, (dst.shape[1], dst.shape[0]), dst=dst, interpolation=interpolation
+            )
+        self._resize_buffers[key] = dst
+        return dst
+
     def _rescale_color_and_depth(
-        self, color_image, depth_image, scaling: float = 0.5
+        self, color_image, depth_image, scaling: float = 0.5, tag: str = "default"
     ) -> Tuple[np.ndarray, np.ndarray]:
-        """Rescale the color and depth images by a given scaling factor."""
-        color_image = cv2.resize(
-            color_image,
-            (0, 0),
-            fx=scaling,
-            fy=scaling,
-            interpolation=cv2.INTER_AREA,
-        )
-        depth_image = cv2.resize(
-            depth_image,
-            (0, 0),
-            fx=scaling,
-            fy=scaling,
-            interpolation=cv2.INTER_NEAREST,
-        )
+        """Rescale the color and depth images by a given scaling factor.
+
+        Callers that rescale more than one camera per tick must pass a distinct tag per
+        camera so the reused output buffers stay separate (see _resize_reuse)."""
+        color_image = self._resize_reuse(color_image, scaling, cv2.INTER_AREA, tag + "/color")
+        depth_image = self._resize_reuse(depth_image, scaling, cv2.INTER_NEAREST, tag + "/depth")
         return color_image, depth_image
 
     def start(self):
@@ -167,6 +225,8 @@ class BaseZmqServer(CommsNode, ABC):
         # Create a stretch client to get information
         sum_time: float = 0
         steps: int = 0
+        period = 1.0 / self.full_obs_rate_hz
+        next_deadline = time.monotonic()
         t0 = timeit.default_timer()
         print("Starting to send full state")
         while self.is_running():
@@ -179,7 +239,10 @@ class BaseZmqServer(CommsNode, ABC):
             if steps == 0:
                 logger.info(f"[SEND LARGE IMAGE STATE] message keys: {data.keys()}")
 
-            self.send_socket.send_pyobj(data)
+            # msgpack instead of pickle: serializing these dicts dominates the loop at high
+            # rates, and pickle is both slower and produces larger frames. copy=False hands
+            # the encoded buffer to zmq's IO thread without another memcpy.
+            self.send_socket.send(serialization.pack(data), copy=False)
 
             # Finish with some speed info
             t1 = timeit.default_timer()
@@ -190,7 +253,7 @@ class BaseZmqServer(CommsNode, ABC):
             if self.verbose or steps % self.report_steps == 0:
                 print(f"[SEND FULL STATE] time taken = {dt} avg = {sum_time/steps}")
 
-            time.sleep(1e-4)
+            next_deadline = self._pace(next_deadline, period)
             t0 = timeit.default_timer()
 
     def spin_recv(self):
@@ -199,9 +262,9 @@ class BaseZmqServer(CommsNode, ABC):
         steps = 0
         t0 = timeit.default_timer()
         while self.is_running():
-            try:
-                action = self.recv_socket.recv_pyobj(flags=zmq.NOBLOCK)
-            except zmq.Again:
+            if self._recv_poller.poll(timeout=5):
+                action = serialization.unpack(self.recv_socket.recv())
+            else:
                 if self.verbose:
                     logger.warning(" - no action received")
                 action = None
@@ -229,7 +292,6 @@ class BaseZmqServer(CommsNode, ABC):
             if self.verbose or steps % self.fast_report_steps == 0:
                 logger.info(f"[RECV] time taken = {dt} avg = {sum_time/steps}")
 
-            time.sleep(1e-4)
             t0 = timeit.default_timer()
 
     def spin_send_state(self):
@@ -237,6 +299,10 @@ class BaseZmqServer(CommsNode, ABC):
         # Create a stretch client to get information
         sum_time: float = 0
         steps: int = 0
+        last_sent: bytes = b""
+        unchanged_ticks: int = 0
+        period = 1.0 / self.state_rate_hz
+        next_deadline = time.monotonic()
         t0 = timeit.default_timer()
         while self.is_running():
             message = self.get_state_message()
@@ -248,7 +314,20 @@ class BaseZmqServer(CommsNode, ABC):
             if steps == 0:
                 logger.info(f"[SEND MINIMAL STATE] message keys: {message.keys()}")
 
-            self.send_state_socket.send_pyobj(message)
+            packed = serialization.pack(message)
+
+            # When the robot is idle the fast state barely changes between ticks; skip the
+            # transmit when the encoded message is identical to the last one sent, with a
+            # periodic refresh so late joiners on this keep-latest channel stay current.
+            # (Per-field deltas would not survive conflation, so whole messages only.)
+            if packed == last_sent and unchanged_ticks < 100:
+                unchanged_ticks += 1
+                next_deadline = self._pace(next_deadline, period)
+                continue
+            last_sent = packed
+            unchanged_ticks = 0
+
+            self.send_state_socket.send(packed, copy=False)
 
             # Finish with some speed info
             t1 = timeit.default_timer()
@@ -259,17 +338,23 @@ class BaseZmqServer(CommsNode, ABC):
             if self.verbose or steps % self.fast_report_steps == 0:
                 logger.info(f"[SEND FAST STATE] time taken = {dt} avg = {sum_time/steps}")
 
-            time.sleep(1e-4)
+            next_deadline = self._pace(next_deadline, period)
             t0 = timeit.default_timer()
 
     def spin_send_servo(self):
         """Send the images here as well; smaller versions designed for better performance."""
         sum_time: float = 0
         steps: int = 0
+        period = 1.0 / self.servo_rate_hz
+        next_deadline = time.monotonic()
         t0 = timeit.default_timer()
 
+        next_message = self._servo_prefetch.submit(self.get_servo_message)
         while not self._done:
-            message = self.get_servo_message()
+            message = next_message.result()
+            # Kick off the next frame's capture+encode right away; it runs while this frame
+            # is packed and handed to the socket below.
+            next_message = self._servo_prefetch.submit(self.get_servo_message)
 
             # Skip if no message - could not access camera yet
             if message is None:
@@ -278,7 +363,7 @@ class BaseZmqServer(CommsNode, ABC):
             if steps == 0:
                 logger.info(f"[SEND SERVO STATE] message keys: {message.keys()}")
 
-            self.send_servo_socket.send_pyobj(message)
+            self.send_servo_socket.send(serialization.pack(message), copy=False)
 
             # Finish with some speed info
             t1 = timeit.default_timer()
@@ -291,7 +376,7 @@ class BaseZmqServer(CommsNode, ABC):
                     f"[SEND SERVO STATE] time taken = {dt} avg = {sum_time/steps} rate={1/(sum_time/steps)}"
                 )
 
-            time.sleep(1e-5)
+            next_deadline = self._pace(next_deadline, period)
             t0 = timeit.default_timer()
 
     def __del__(self):
@@ -305,6 +390,9 @@ class BaseZmqServer(CommsNode, ABC):
         self._send_state_thread.join()
         self._send_servo_thread.join()
 
+        self._servo_prefetch.shutdown(wait=False)
+        self._encode_pool.shutdown(wait=False)
+
         # Close sockets
         self.recv_socket.close()
         self.send_socket.close()
@@ -7,12 +7,15 @@
 # Some code may be adapted from other open-source works with their respective licenses. Original
 # license information maybe found below, if so.
 
+import logging
 from typing import Tuple
 
 import numpy as np
 import pyrealsense2 as rs
 
-from stretch.drivers.realsense_base import Realsense
+from stretch.drivers.realsense_base import Realsense, list_cameras
+
+logger = logging.getLogger(__name__)
 
 exposure_keywords = ["low", "medium", "auto"]
 exposure_range = [0, 500000]
@@ -22,10 +25,10 @@ class D405(Realsense):
     def __init__(self, exposure):
         self.pipeline, self.profile = start_d405(exposure)
 
-        print("Connecting to D405 and getting camera info...")
+        logger.info("Connecting to D405 and getting camera info...")
         self.depth_camera_info, self.color_camera_info = self.read_camera_infos()
-        print(f"  depth camera: {self.depth_camera_info}")
-        print(f"  color camera: {self.color_camera_info}")
+        logger.debug(f"  depth camera: {self.depth_camera_info}")
+        logger.debug(f"  color camera: {self.color_camera_info}")
 
     def get_camera_infos(self):
         return self.depth_camera_info, self.color_camera_info
@@ -94,32 +97,21 @@ def prepare_exposure_value(value):
 
 
 def start_d405(exposure):
-    camera_info = [
-        {
-            "name": device.get_info(rs.camera_info.name),
-            "serial_number": device.get_info(rs.camera_info.serial_number),
-        }
-        for device in rs.context().devices
-    ]
+    camera_info = list_cameras()
 
     exposure = prepare_exposure_value(exposure)
 
-    print("All cameras that were found:")
-    print(camera_info)
-    print()
+    logger.debug(f"All cameras that were found: {camera_info}")
 
     d405_info = None
     for info in camera_info:
         if info["name"].endswith("D405"):
             d405_info = info
     if d405_info is None:
-        print("D405 camera not found")
-        print("Exiting")
+        logger.error("D405 camera not found. Exiting.")
         exit()
     else:
-        print("D405 found:")
-        print(d405_info)
-        print()
+        logger.debug(f"D405 found: {d405_info}")
 
     pipeline = rs.pipeline()
     config = rs.config()
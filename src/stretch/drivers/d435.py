@@ -7,12 +7,15 @@
 # Some code may be adapted from other open-source works with their respective licenses. Original
 # license information maybe found below, if so.
 
+import logging
 from typing import Tuple
 
 import numpy as np
 import pyrealsense2 as rs
 
-from stretch.drivers.realsense_base import Realsense
+from stretch.drivers.realsense_base import Realsense, list_cameras
+
+logger = logging.getLogger(__name__)
 
 WIDTH, HEIGHT, FPS = 640, 480, 30
 # WIDTH, HEIGHT, FPS = 640, 480, 15
@@ -22,22 +25,27 @@ class D435i(Realsense):
     """Wrapper for accessing data from a D435 realsense camera, used as the head camera on Stretch RE1, RE2, and RE3."""
 
     def __init__(self, exposure: str = "auto", camera_number: int = 0):
-        print("Connecting to D435i and getting camera info...")
+        logger.info("Connecting to D435i and getting camera info...")
         self._setup_camera(exposure=exposure, number=camera_number)
         self.depth_camera_info, self.color_camera_info = self.read_camera_infos()
-        print(f"  depth camera: {self.depth_camera_info}")
-        print(f"  color camera: {self.color_camera_info}")
+        logger.debug(f"  depth camera: {self.depth_camera_info}")
+        logger.debug(f"  color camera: {self.color_camera_info}")
 
     def get_camera_infos(self):
         return self.depth_camera_info, self.color_camera_info
 
+    def wait_for_frames(self) -> rs.composite_frame:
+        """Block until the next frameset arrives on the size-1 frame queue."""
+        return rs.composite_frame(self.queue.wait_for_frame())
+
     def get_images(self) -> Tuple[np.ndarray, np.ndarray]:
         """Get a pair of numpy arrays for the images we want to use."""
 
         # Get the frames from the realsense
         frames = self.wait_for_frames()
 
-        # Align the depth frame to color frame
+        # Align the depth frame to color frame. Alignment is a software reprojection, so it
+        # only runs here - when a consumer actually asks for images - not per captured frame.
         aligned_frames = self.align.process(frames)
 
         # Get aligned frames
@@ -54,17 +62,11 @@ class D435i(Realsense):
             number(int): which camera to pick in order.
         """
 
-        camera_info = [
-            {
-                "name": device.get_info(rs.camera_info.name),
-                "serial_number": device.get_info(rs.camera_info.serial_number),
-            }
-            for device in rs.context().devices
-        ]
-        print("Searching for D435i...")
+        camera_info = list_cameras()
+        logger.debug("Searching for D435i...")
         d435i_infos = []
         for i, info in enumerate(camera_info):
-            print(i, info["name"], info["serial_number"])
+            logger.debug(f"{i} {info['name']} {info['serial_number']}")
             if "D435I" in info["name"]:
                 d435i_infos.append(info)
 
@@ -79,7 +81,11 @@ class D435i(Realsense):
         self.config.enable_device(d435i_infos[number]["serial_number"])
         self.config.enable_stream(rs.stream.depth, WIDTH, HEIGHT, rs.format.z16, FPS)
         self.config.enable_stream(rs.stream.color, WIDTH, HEIGHT, rs.format.bgr8, FPS)
-        self.profile = self.pipeline.start(self.config)
+        # Deliver frames through a queue of size 1 so a slow consumer always reads the latest
+        # frame instead of draining a backlog; stale frames are dropped intentionally. The
+        # default pipeline queue can hold many frames and adds seconds of latency.
+        self.queue = rs.frame_queue(1, keep_frames=False)
+        self.profile = self.pipeline.start(self.config, self.queue)
 
         # Create an align object to align depth frames to color frames
         self.align_to = rs.stream.color
@@ -8,11 +8,36 @@
 # license information maybe found below, if so.
 
 import abc
+import logging
+from functools import lru_cache
 from typing import Tuple
 
 import numpy as np
 import pyrealsense2 as rs
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def list_cameras() -> Tuple[dict, ...]:
+    """Enumerate connected realsense devices, once per process.
+
+    Enumeration is a blocking USB scan costing tens of milliseconds, so the result is
+    cached; reconnect handling that needs a fresh scan can call list_cameras.cache_clear().
+
+    Returns:
+        Tuple of dicts with the name and serial number of each connected device.
+    """
+    cameras = tuple(
+        {
+            "name": device.get_info(rs.camera_info.name),
+            "serial_number": device.get_info(rs.camera_info.serial_number),
+        }
+        for device in rs.context().devices
+    )
+    logger.debug(f"Realsense cameras found: {cameras}")
+    return cameras
+
 
 class Realsense(abc.ABC):
     def __init__(self, exposure: str = "auto"):
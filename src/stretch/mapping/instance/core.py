@@ -137,6 +137,8 @@ class Instance:
     score: float = None
     """Confidence score of bbox detection"""
     score_aggregation_method: str = "max"
+    _cached_center: Tensor = None
+    """Lazily computed center of the instance; cleared whenever the point cloud changes"""
 
     @property
     def id(self) -> int:
@@ -200,19 +202,24 @@ class Instance:
         return self.global_id
 
     def get_center(self) -> Tensor:
-        """Get the center of the instance in 3D space
+        """Get the center of the instance in 3D space. The result is cached, since the grasp
+        operations query it repeatedly per pickup cycle and the reduction may force a GPU sync.
 
         Returns:
             Tensor: [3,] tensor of the center of the instance
         """
+        if self._cached_center is not None:
+            return self._cached_center
         xyz = self.point_cloud.mean(dim=0)
         # Find the point closest to the xy center
         xy = xyz[:2]
         dists = torch.norm(self.point_cloud[:, :2] - xy, dim=1)
         idx = dists.argmin()
-        center_xyz = self.point_cloud[idx]
+        # Clone so we do not mutate a row of the point cloud below
+        center_xyz = self.point_cloud[idx].clone()
         # use the actual mean z
         center_xyz[2] = xyz[2]
+        self._cached_center = center_xyz
         return center_xyz
 
     def show_best_view(self, metric: str = "area", title: Optional[str] = None) -> None:
@@ -226,6 +233,8 @@ class Instance:
         cv2.destroyAllWindows()
 
     def add_instance_view(self, instance_view: InstanceView):
+        # The point cloud is about to change, so the cached center is stale
+        self._cached_center = None
         if len(self.instance_views) == 0:
             # instantiate from instance
             self.category_id = instance_view.category_id
@@ -547,9 +547,8 @@ class HelloStretchKinematics:
 
     def ik(self, pose, q0):
         pos, rot = pose
-        se3 = Rotation.from_quat(rot).as_matrix()
         pose = np.eye(4)
-        pose[:3, :3] = np.array(se3).reshape(3, 3)
+        pose[:3, :3] = Rotation.from_quat(rot).as_matrix()
         x, y, z = pos
         pose[:3, 3] = np.array([x, y, z - self.base_height])
         q, success, debug_info = self.ik_solver.compute_ik(pose, self._to_ik_format(q0))
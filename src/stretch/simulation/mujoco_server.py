@@ -34,7 +34,7 @@ from stretch.motion import HelloStretchIdx
 from stretch.motion.control.goto_controller import GotoVelocityController
 from stretch.utils.config import get_control_config
 from stretch.utils.geometry import xyt_base_to_global
-from stretch.utils.image import scale_camera_matrix
+from stretch.utils.image import depth_to_u16, scale_camera_matrix
 
 # Maps HelloStretchIdx to actuators
 mujoco_actuators = {
@@ -431,14 +431,15 @@ class MujocoZmqServer(BaseZmqServer):
         width, height = rgb.shape[:2]
 
         # Convert depth into int format
-        depth = (depth * 1000).astype(np.uint16)
+        depth = depth_to_u16(depth)
+        depth_shape = depth.shape
 
         # Get the joint state
         positions, _, _ = self.get_joint_state()
 
-        # Make both into jpegs
+        # Compress both for the wire
         rgb = compression.to_jpg(rgb)
-        depth = compression.to_jp2(depth)
+        depth = compression.to_depth(depth)
 
         xyt = self.get_base_pose()
 
@@ -446,6 +447,7 @@ class MujocoZmqServer(BaseZmqServer):
         message = {
             "rgb": rgb,
             "depth": depth,
+            "depth/shape": depth_shape,
             "camera_K": cam_data["cam_d435i_K"],
             "camera_pose": self.get_head_camera_pose(),
             "ee_pose": self.get_ee_pose(),
@@ -498,20 +500,20 @@ class MujocoZmqServer(BaseZmqServer):
         # ee_color_image = adjust_gamma(ee_color_image, 2.5)
 
         ee_color_image, ee_depth_image = self._rescale_color_and_depth(
-            ee_color_image, ee_depth_image, self.ee_image_scaling
+            ee_color_image, ee_depth_image, self.ee_image_scaling, tag="ee_cam"
         )
         head_color_image, head_depth_image = self._rescale_color_and_depth(
-            head_color_image, head_depth_image, self.image_scaling
+            head_color_image, head_depth_image, self.image_scaling, tag="head_cam"
         )
 
         # Conversion
-        ee_depth_image = (ee_depth_image * 1000).astype(np.uint16)
-        head_depth_image = (head_depth_image * 1000).astype(np.uint16)
+        ee_depth_image = depth_to_u16(ee_depth_image)
+        head_depth_image = depth_to_u16(head_depth_image)
 
         # Compress the images
-        compressed_ee_depth_image = compression.to_jp2(ee_depth_image)
+        compressed_ee_depth_image = compression.to_depth(ee_depth_image)
         compressed_ee_color_image = compression.to_jpg(ee_color_image)
-        compressed_head_depth_image = compression.to_jp2(head_depth_image)
+        compressed_head_depth_image = compression.to_depth(head_depth_image)
         compressed_head_color_image = compression.to_jpg(head_color_image)
 
         # Get position info
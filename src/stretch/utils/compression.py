@@ -8,13 +8,36 @@
 # license information maybe found below, if so.
 
 import io
+import os
 from typing import Optional, Tuple, Union
 
 import cv2
 import liblzfse
+import lz4.frame
 import numpy as np
 from PIL import Image
 
+try:
+    # Optional: libjpeg-turbo is several times faster than OpenCV's default encoder thanks to
+    # SIMD-accelerated DCT and color conversion. Fall back to cv2 if it is not installed.
+    from turbojpeg import TurboJPEG
+
+    _turbo_jpeg = TurboJPEG()
+except (ImportError, OSError):
+    _turbo_jpeg = None
+
+try:
+    # Optional: lets to_jpg encode CUDA tensors on the GPU via nvjpeg, so only the
+    # compressed bytes cross PCIe instead of the full frame.
+    import torch
+    from torchvision.io import encode_jpeg as _tv_encode_jpeg
+except ImportError:
+    torch = None
+
+# OpenJPEG (the jp2 codec behind cv2.imencode) consults this when a codec is created; let the
+# depth encodes use its internal threading unless the caller has already configured it.
+os.environ.setdefault("OPJ_NUM_THREADS", "4")
+
 
 ## Compress Python Object to Bytes
 def zip_depth(obj: np.ndarray):
@@ -87,6 +110,35 @@ def from_webp(webp_data) -> np.ndarray:
     return arr
 
 
+def to_depth(depth: np.ndarray) -> bytes:
+    """Compress a uint16 depth image for the wire.
+
+    LZ4 on raw uint16 runs at hundreds of MB/s per core where JPEG2000 encodes at tens,
+    while depth maps' run-length structure still compresses well. The shape is not stored;
+    it must travel in the message header for from_depth to reconstruct the array.
+
+    Args:
+        depth: Depth image, converted to uint16 (e.g. millimeters) if it is not already.
+
+    Returns:
+        bytes: The compressed depth data.
+    """
+    return lz4.frame.compress(np.ascontiguousarray(depth, dtype=np.uint16).tobytes())
+
+
+def from_depth(compressed_bytes: bytes, shape: Tuple[int, int]) -> np.ndarray:
+    """Reconstruct a uint16 depth image compressed with to_depth.
+
+    Args:
+        compressed_bytes: Output of to_depth.
+        shape: The (rows, cols) shape of the original depth image.
+
+    Returns:
+        The decompressed depth image.
+    """
+    return np.frombuffer(lz4.frame.decompress(compressed_bytes), dtype=np.uint16).reshape(shape)
+
+
 def to_jp2(image: np.ndarray, quality: int = 800):
     """Depth is better encoded as jp2"""
     _, compressed_image = cv2.imencode(
@@ -95,14 +147,28 @@ def to_jp2(image: np.ndarray, quality: int = 800):
     return compressed_image
 
 
-def to_jpg(image: np.ndarray, quality: int = 90):
-    """Encode as jpeg"""
+def to_jpg(image: Union[np.ndarray, "torch.Tensor"], quality: int = 90):
+    """Encode as jpeg. Input is HWC uint8 in BGR channel order, like the rest of this module.
+
+    CUDA tensors are encoded on the GPU with nvjpeg (via torchvision) so the full frame never
+    crosses back over PCIe - only the compressed bytes do. Everything else takes the CPU path.
+    """
+    if torch is not None and isinstance(image, torch.Tensor) and image.is_cuda:
+        # nvjpeg wants CHW in RGB order; flip BGR->RGB before permuting
+        compressed = _tv_encode_jpeg(image.flip(-1).permute(2, 0, 1).contiguous(), quality=quality)
+        return compressed.cpu().numpy().tobytes()
+    if _turbo_jpeg is not None:
+        return _turbo_jpeg.encode(image, quality=quality)
     _, compressed_image = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
     return compressed_image
 
 
 def from_jpg(compressed_image: Union[bytes, np.ndarray]) -> np.ndarray:
     """Convert compressed image to numpy array"""
+    if _turbo_jpeg is not None:
+        if isinstance(compressed_image, np.ndarray):
+            compressed_image = compressed_image.tobytes()
+        return _turbo_jpeg.decode(compressed_image)
     if isinstance(compressed_image, bytes):
         compressed_image = np.frombuffer(compressed_image, dtype=np.uint8)
     return cv2.imdecode(compressed_image, cv2.IMREAD_COLOR)
@@ -10,17 +10,25 @@
 import datetime
 import json
 import logging
+import os
 import shutil
 import subprocess
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional, Union
 
 import cv2
-import liblzfse
+import lz4.frame
 import numpy as np
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import stretch.utils.git_tools as git_tools
 
 logger = logging.getLogger(__name__)
@@ -37,13 +45,55 @@ RGB_FOLDER_NAME = "compressed_gripper_images"
 HEAD_DEPTH_FOLDER_NAME = "compressed_head_depths"
 HEAD_RGB_FOLDER_NAME = "compressed_head_images"
 
-COMPLETED_DEPTH_FILENAME = "compressed_np_gripper_depth_float32.bin"
-COMPLETED_HEAD_DEPTH_FILENAME = "compressed_np_head_depth_float32.bin"
+COMPLETED_DEPTH_FILENAME = "compressed_np_gripper_depth_uint16.lz4"
+COMPLETED_HEAD_DEPTH_FILENAME = "compressed_np_head_depth_uint16.lz4"
+
+# Unit of the stored uint16 depth values, in meters (i.e. depth is stored as millimeters,
+# matching the native precision of the realsense z16 stream).
+DEPTH_UNIT = 0.001
 
 
 class FileDataRecorder:
     """A class for writing out data to files for use in learning from demonstration. This one will create a folder structure with images and a text file containing position information."""
 
+    # Whether ffmpeg has NVENC hardware encoders; probed once per process, shared by instances.
+    _nvenc_available: Optional[bool] = None
+
+    @classmethod
+    def _has_nvenc(cls) -> bool:
+        """Check (once) whether ffmpeg can actually encode with NVENC.
+
+        Listing the encoder is not enough: ffmpeg builds commonly include h264_nvenc on
+        machines with no usable GPU, where the encoder only fails at startup. Probe with a
+        one-frame test encode so the answer reflects the hardware, not the build flags.
+        """
+        if cls._nvenc_available is None:
+            command = [
+                "ffmpeg",
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-f",
+                "lavfi",
+                "-i",
+                "color=black:s=64x64",
+                "-frames:v",
+                "1",
+                "-c:v",
+                "h264_nvenc",
+                "-f",
+                "null",
+                "-",
+            ]
+            try:
+                result = subprocess.run(command, capture_output=True, timeout=10)
+                cls._nvenc_available = result.returncode == 0
+            except (OSError, subprocess.TimeoutExpired):
+                cls._nvenc_available = False
+            if cls._nvenc_available:
+                logger.info("Using NVENC hardware video encoding")
+        return cls._nvenc_available
+
     def __init__(
         self,
         datadir: Union[str, Path] = "./data",
@@ -53,6 +103,7 @@ class FileDataRecorder:
         save_images: bool = False,
         metadata: dict = None,
         fps: int = 15,
+        max_steps: int = 3000,
     ):
         """Initialize the recorder.
 
@@ -62,6 +113,7 @@ class FileDataRecorder:
             user: The name of the user.
             env: The name of the environment.
             fps: The fps to write videos at
+            max_steps: Initial capacity of the preallocated frame buffers; grown if exceeded
         """
         if isinstance(datadir, Path):
             self.datadir = datadir
@@ -76,18 +128,55 @@ class FileDataRecorder:
 
         self.metadata = metadata
         self.fps = fps
+        self.max_steps = max_steps
 
         self.reset()
 
     def reset(self):
         """Clear the data stored in the recorder."""
-        self.rgbs = []
-        self.depths = []
+        # End effector frames go into preallocated arrays (sized lazily once the first frame
+        # reveals the resolution) so long episodes do not churn through per-frame list
+        # allocations plus a full-stack copy at write time. Head frames may be absent on any
+        # given step, so those stay as lists.
+        # The depth buffer is backed by a memmap on a temp file rather than RAM: depth is the
+        # largest tensor we hold, and keeping it on disk caps peak memory on long episodes
+        # (important on Jetson). The OS page cache makes the per-step writes effectively free.
+        if getattr(self, "_depth_mmap_path", None) is not None:
+            try:
+                os.unlink(self._depth_mmap_path)
+            except OSError:
+                pass
+        self._depth_mmap_path = None
+        # Kill any leftover streaming encoders from an abandoned episode and re-enable
+        # streaming for the next one.
+        self._abort_stream_encoders()
+        self._stream_encoding = True
+        self.rgb_buf = None
+        self.depth_buf = None
         self.head_rgbs = []
         self.head_depths = []
+        # Numeric per-step labels are stored structure-of-arrays for the same reason: one
+        # buffer write per step instead of a dict full of freshly converted Python floats.
+        # Shapes vary by caller (e.g. placeholder vs full pose), so these are also sized
+        # lazily from the first add().
+        self.xyz_buf = None
+        self.quat_buf = None
+        self.gripper_buf = None
+        self.ee_pos_buf = None
+        self.ee_rot_buf = None
         self.data_dicts = {}
         self.step = 0
 
+    @property
+    def rgbs(self) -> np.ndarray:
+        """View of the end effector RGB frames recorded so far."""
+        return [] if self.rgb_buf is None else self.rgb_buf[: self.step]
+
+    @property
+    def depths(self) -> np.ndarray:
+        """View of the end effector depth frames recorded so far."""
+        return [] if self.depth_buf is None else self.depth_buf[: self.step]
+
     def add(
         self,
         ee_rgb: np.ndarray,
@@ -103,17 +192,56 @@ class FileDataRecorder:
         head_depth: Optional[np.ndarray] = None,
     ):
         """Add data to the recorder."""
-        self.rgbs.append(ee_rgb)
-        self.depths.append(ee_depth)
+        if self.rgb_buf is None:
+            self.rgb_buf = np.empty((self.max_steps,) + ee_rgb.shape, dtype=ee_rgb.dtype)
+            with tempfile.NamedTemporaryFile(suffix=".depth", delete=False) as f:
+                self._depth_mmap_path = f.name
+            self.depth_buf = np.memmap(
+                self._depth_mmap_path,
+                dtype=ee_depth.dtype,
+                mode="w+",
+                shape=(self.max_steps,) + ee_depth.shape,
+            )
+            self.xyz_buf = np.empty((self.max_steps,) + np.shape(xyz))
+            self.quat_buf = np.empty((self.max_steps,) + np.shape(quaternion))
+            self.gripper_buf = np.empty(self.max_steps)
+            self.ee_pos_buf = np.empty((self.max_steps,) + np.shape(ee_pos))
+            self.ee_rot_buf = np.empty((self.max_steps,) + np.shape(ee_rot))
+        elif self.step >= self.rgb_buf.shape[0]:
+            # Episode outgrew the preallocation; double the buffers (amortized O(1) per frame)
+            self.rgb_buf = np.concatenate([self.rgb_buf, np.empty_like(self.rgb_buf)], axis=0)
+            # Growing the memmap is just extending the backing file and remapping - no copy
+            new_shape = (2 * self.depth_buf.shape[0],) + self.depth_buf.shape[1:]
+            self.depth_buf.flush()
+            os.truncate(
+                self._depth_mmap_path, int(np.prod(new_shape)) * self.depth_buf.dtype.itemsize
+            )
+            self.depth_buf = np.memmap(
+                self._depth_mmap_path, dtype=self.depth_buf.dtype, mode="r+", shape=new_shape
+            )
+            self.xyz_buf = np.concatenate([self.xyz_buf, np.empty_like(self.xyz_buf)], axis=0)
+            self.quat_buf = np.concatenate([self.quat_buf, np.empty_like(self.quat_buf)], axis=0)
+            self.gripper_buf = np.concatenate(
+                [self.gripper_buf, np.empty_like(self.gripper_buf)], axis=0
+            )
+            self.ee_pos_buf = np.concatenate(
+                [self.ee_pos_buf, np.empty_like(self.ee_pos_buf)], axis=0
+            )
+            self.ee_rot_buf = np.concatenate(
+                [self.ee_rot_buf, np.empty_like(self.ee_rot_buf)], axis=0
+            )
+        self.rgb_buf[self.step] = ee_rgb
+        self.depth_buf[self.step] = ee_depth
+        self.xyz_buf[self.step] = xyz
+        self.quat_buf[self.step] = quaternion
+        self.gripper_buf[self.step] = gripper
+        self.ee_pos_buf[self.step] = ee_pos
+        self.ee_rot_buf[self.step] = ee_rot
         self.head_rgbs.append(head_rgb)
         self.head_depths.append(head_depth)
+        self._stream_frames(ee_rgb, head_rgb)
         self.data_dicts[self.step] = {
-            "xyz": xyz.tolist(),
-            "quats": quaternion.tolist(),
-            "gripper": gripper,
             "step": self.step,
-            "ee_pos": ee_pos.tolist(),
-            "ee_rot": ee_rot.tolist(),
             "observations": observations,
             "actions": actions,
             "waypoints": {},
@@ -129,24 +257,36 @@ class FileDataRecorder:
         episode_dir = self.task_dir / now
         episode_dir.mkdir()
 
-        # Write the images
-        print("Write end effector camera feed...")
-        for i, (rgb, depth) in tqdm(enumerate(zip(self.rgbs, self.depths)), ncols=80):
-            self.write_image(rgb, depth, episode_dir, i)
-
-        print("Write head camera feed...")
-        for i, (rgb, depth) in tqdm(enumerate(zip(self.head_rgbs, self.head_depths)), ncols=80):
-            if rgb is None or depth is None:
-                continue
-            self.write_image(rgb, depth, episode_dir, i, head=True)
-
-        # Run video processing
-        print("Processing end effector camera feed...")
-        self.process_rgb_to_video(episode_dir)
-        self.process_depth_to_bin(episode_dir)
-        print("Processing head camera feed...")
-        self.process_rgb_to_video(episode_dir, head=True)
-        self.process_depth_to_bin(episode_dir, head=True)
+        # Write out per-frame PNGs only when raw images were requested; the videos below are
+        # encoded straight from memory, so the PNG pass is purely for inspection/debugging.
+        if self.save_images:
+            print("Write end effector camera feed...")
+            for i, (rgb, depth) in tqdm(enumerate(zip(self.rgbs, self.depths)), ncols=80):
+                self.write_image(rgb, depth, episode_dir, i)
+
+            print("Write head camera feed...")
+            for i, (rgb, depth) in tqdm(
+                enumerate(zip(self.head_rgbs, self.head_depths)), ncols=80
+            ):
+                if rgb is None or depth is None:
+                    continue
+                self.write_image(rgb, depth, episode_dir, i, head=True)
+
+        # Run video processing. Video encoding and depth compression have no data dependency
+        # and different bottlenecks (ffmpeg saturates CPU cores and disk; LZ4 is a single
+        # thread), so run them concurrently and close the episode in max() rather than sum()
+        # of the two times. Everything reads from the in-memory buffers, and reset() only
+        # happens after all four futures complete.
+        print("Processing camera feeds...")
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            futures = [
+                ex.submit(self._finish_rgb_video, episode_dir),
+                ex.submit(self.process_depth_to_bin, episode_dir),
+                ex.submit(self._finish_rgb_video, episode_dir, True),
+                ex.submit(self.process_depth_to_bin, episode_dir, True),
+            ]
+            for future in futures:
+                future.result()
 
         print("Writing metadata...")
 
@@ -169,12 +309,44 @@ class FileDataRecorder:
                 else:
                     file.write("Failure")
 
-        with open(episode_dir / "labels.json", "w") as f:
-            json.dump(self.data_dicts, f)
+        # Numeric labels go out as arrays in one shot, and are also re-injected into the
+        # per-step dicts below so labels.json keeps its full schema for downstream ingestion
+        # (dobb-e / lerobot read the per-step fields from the json).
+        if self.xyz_buf is not None:
+            for i in range(self.step):
+                data_dict = self.data_dicts[i]
+                data_dict["xyz"] = self.xyz_buf[i].tolist()
+                data_dict["quats"] = self.quat_buf[i].tolist()
+                data_dict["gripper"] = self.gripper_buf[i].tolist()
+                data_dict["ee_pos"] = self.ee_pos_buf[i].tolist()
+                data_dict["ee_rot"] = self.ee_rot_buf[i].tolist()
+            np.savez_compressed(
+                episode_dir / "labels.npz",
+                xyz=self.xyz_buf[: self.step],
+                quats=self.quat_buf[: self.step],
+                gripper=self.gripper_buf[: self.step],
+                ee_pos=self.ee_pos_buf[: self.step],
+                ee_rot=self.ee_rot_buf[: self.step],
+            )
+        if orjson is not None:
+            # orjson serializes the nested per-step dicts in a tight C loop and handles
+            # numpy scalars natively; NON_STR_KEYS matches stdlib json's handling of the
+            # integer step and waypoint keys.
+            with open(episode_dir / "labels.json", "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        self.data_dicts,
+                        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                    )
+                )
+        else:
+            with open(episode_dir / "labels.json", "w") as f:
+                json.dump(self.data_dicts, f)
 
         # Add episode info to metadata
         self.metadata["date"] = now
         self.metadata["num_frames"] = len(self.rgbs)
+        self.metadata["depth_unit"] = DEPTH_UNIT
 
         # Collect git information if it exists
         self.metadata["git_branch"] = git_tools.get_git_branch()
@@ -222,61 +394,209 @@ class FileDataRecorder:
                 shutil.rmtree(folder)
 
     def process_rgb_to_video(self, episode_dir, head: bool = False):
+        """Encode the recorded RGB frames to video by streaming them into ffmpeg's stdin as
+        raw BGR frames. This avoids writing (and libpng-compressing) every frame to disk just
+        so ffmpeg can read it back again."""
         start_time = time.perf_counter()
-        # First, find out a sample filename
         if head:
-            rgb_dir = episode_dir / HEAD_RGB_FOLDER_NAME
+            frames = [rgb for rgb in self.head_rgbs if rgb is not None]
             h264_video_path = episode_dir / HEAD_RGB_VIDEO_H264_NAME
         else:
-            rgb_dir = episode_dir / RGB_FOLDER_NAME
+            frames = self.rgbs
             h264_video_path = episode_dir / RGB_VIDEO_H264_NAME
-        try:
-            sample_filename = next(rgb_dir.glob("*.png"))
-        except StopIteration:
-            sample_filename = None
-        if sample_filename is None:
-            logging.error(f"No images found in {rgb_dir}")
+        if len(frames) == 0:
+            logging.error(f"No frames recorded for {episode_dir}")
             return
 
-        # Find out if the filename is 4 or 6 digits long.
-        if len(sample_filename.stem) == 4:
-            filename_format = "%04d.png"
-        elif len(sample_filename.stem) == 6:
-            filename_format = "%06d.png"
-        else:
-            logging.error(f"Unknown filename format: {sample_filename.stem}")
-            return
+        height, width = frames[0].shape[:2]
 
         # Now, we create the videos using ffmpeg.
         # First, we will create the h264 video.
         # Additional codecs can be output by adding to the list and providing corresponding video paths
         crfs = [30]
         video_codecs = ["h264"]
+        procs = []
+        commands = []
         for enc_lib, crf, final_video_path in zip(video_codecs, crfs, [h264_video_path]):
-            command = [
-                "ffmpeg",
-                "-y",
-                "-framerate",
-                f"{self.fps}",
-                "-i",
-                str(rgb_dir / "{}").format(filename_format),
+            command = self._ffmpeg_command(width, height, enc_lib, crf, final_video_path)
+            procs.append(
+                subprocess.Popen(
+                    command,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                )
+            )
+            commands.append(command)
+
+        # Feed every encoder frame by frame so the codecs run concurrently rather than one
+        # finishing before the next starts.
+        try:
+            for frame in frames:
+                buf = np.ascontiguousarray(frame).tobytes()
+                for process in procs:
+                    process.stdin.write(buf)
+            for process, command in zip(procs, commands):
+                stdout, stderr = process.communicate()
+                if process.returncode != 0:
+                    raise subprocess.CalledProcessError(
+                        process.returncode, command, stdout, stderr
+                    )
+                logging.debug(stderr.decode("utf-8"))
+        except (OSError, subprocess.CalledProcessError):
+            for process in procs:
+                process.kill()
+                process.wait()
+            # If NVENC passed its probe but failed on a real encode (e.g. the GPU went
+            # away), demote to the CPU encoder and retry rather than losing the episode.
+            if type(self)._nvenc_available:
+                logger.warning("NVENC encode failed at runtime; retrying with CPU encoder")
+                type(self)._nvenc_available = False
+                return self.process_rgb_to_video(episode_dir, head=head)
+            raise
+
+        end_time = time.perf_counter()
+        logger.info(f"Saved RGB video to {episode_dir} in {end_time - start_time}s")
+
+    def _codec_args(self, enc_lib: str, crf: int) -> list:
+        """Build the encoder portion of an ffmpeg command line."""
+        if self._has_nvenc():
+            # Hand the encode to the GPU when available; NVENC uses -cq rather than -crf
+            # for constant-quality rate control.
+            return [
                 "-c:v",
-                enc_lib,
-                "-crf",
+                f"{enc_lib}_nvenc",
+                "-preset",
+                "p4",
+                "-tune",
+                "ll",
+                "-rc",
+                "vbr",
+                "-cq",
                 str(crf),
-                str(final_video_path),
             ]
-            process = subprocess.run(
+        return ["-c:v", enc_lib, "-crf", str(crf)]
+
+    def _ffmpeg_command(
+        self, width: int, height: int, enc_lib: str, crf: int, final_video_path
+    ) -> list:
+        """Build an ffmpeg command line that encodes raw BGR frames from stdin."""
+        return [
+            "ffmpeg",
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "bgr24",
+            "-s",
+            f"{width}x{height}",
+            "-framerate",
+            f"{self.fps}",
+            "-i",
+            "pipe:0",
+            *self._codec_args(enc_lib, crf),
+            str(final_video_path),
+        ]
+
+    def _start_stream_encoder(self, frame_shape) -> Optional[dict]:
+        """Launch a long-running ffmpeg process that encodes frames as they are recorded.
+
+        The encoder writes to a temp file that write() moves into the episode directory, so
+        ffmpeg startup and most of the encode happen during the episode instead of being
+        paid at episode close. Returns None if the process could not be started.
+        """
+        height, width = frame_shape[:2]
+        with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
+            tmp_path = f.name
+        command = self._ffmpeg_command(width, height, "h264", 30, tmp_path)
+        try:
+            proc = subprocess.Popen(
                 command,
-                capture_output=True,
-                check=True,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
             )
-            process.check_returncode()
-            logging.info(process.stdout.decode("utf-8"))
-            logging.debug(process.stderr.decode("utf-8"))
+        except OSError:
+            os.unlink(tmp_path)
+            return None
+        return {"proc": proc, "command": command, "path": tmp_path}
 
-        end_time = time.perf_counter()
-        logger.info(f"Saved RGB video to {episode_dir} in {end_time - start_time}s")
+    def _stream_frames(self, ee_rgb: np.ndarray, head_rgb: Optional[np.ndarray]) -> None:
+        """Feed this step's RGB frames to the streaming encoders, starting them lazily.
+
+        On any failure the encoders are torn down and write() falls back to encoding the
+        buffered frames from scratch.
+        """
+        if not self._stream_encoding:
+            return
+        try:
+            if self._ee_encoder is None:
+                self._ee_encoder = self._start_stream_encoder(ee_rgb.shape)
+                if self._ee_encoder is None:
+                    raise OSError("could not start ffmpeg")
+            self._ee_encoder["proc"].stdin.write(np.ascontiguousarray(ee_rgb).tobytes())
+            if head_rgb is not None:
+                if self._head_encoder is None:
+                    self._head_encoder = self._start_stream_encoder(head_rgb.shape)
+                    if self._head_encoder is None:
+                        raise OSError("could not start ffmpeg")
+                self._head_encoder["proc"].stdin.write(np.ascontiguousarray(head_rgb).tobytes())
+        except OSError as e:
+            logger.error(f"Streaming video encode failed ({e}); will encode at episode close")
+            self._abort_stream_encoders()
+            self._stream_encoding = False
+
+    def _abort_stream_encoders(self) -> None:
+        """Kill any live streaming encoders and remove their temp files."""
+        for encoder in (getattr(self, "_ee_encoder", None), getattr(self, "_head_encoder", None)):
+            if encoder is None:
+                continue
+            try:
+                encoder["proc"].kill()
+                encoder["proc"].wait()
+            except OSError:
+                pass
+            try:
+                os.unlink(encoder["path"])
+            except OSError:
+                pass
+        self._ee_encoder = None
+        self._head_encoder = None
+
+    def _finish_rgb_video(self, episode_dir: Path, head: bool = False) -> None:
+        """Finalize the streaming encoder for this camera, or fall back to a full encode."""
+        encoder = self._head_encoder if head else self._ee_encoder
+        if encoder is None:
+            self.process_rgb_to_video(episode_dir, head=head)
+            return
+        final_video_path = episode_dir / (HEAD_RGB_VIDEO_H264_NAME if head else RGB_VIDEO_H264_NAME)
+        encoder["proc"].stdin.close()
+        stdout, stderr = encoder["proc"].communicate()
+        if encoder["proc"].returncode != 0:
+            # The frames are still buffered in memory, so a failed streaming encode is
+            # recoverable: re-encode from scratch like the mid-episode failure path does
+            # rather than losing the episode's video.
+            logger.error(
+                f"Streaming encoder failed at finalize ({stderr.decode(errors='replace')}); "
+                "re-encoding from buffered frames"
+            )
+            try:
+                os.unlink(encoder["path"])
+            except OSError:
+                pass
+            if head:
+                self._head_encoder = None
+            else:
+                self._ee_encoder = None
+            self.process_rgb_to_video(episode_dir, head=head)
+            return
+        shutil.move(encoder["path"], final_video_path)
+        if head:
+            self._head_encoder = None
+        else:
+            self._ee_encoder = None
 
     def add_waypoint(self, idx: int, robot_pose: np.ndarray, gripper: float) -> bool:
         """
@@ -306,15 +626,26 @@ class FileDataRecorder:
             all_depth_data = np.stack(self.head_depths, axis=0)
             target_depth_filename = episode_dir / COMPLETED_HEAD_DEPTH_FILENAME
         else:
-            all_depth_data = np.stack(self.depths, axis=0)
+            # Already contiguous in the (disk-backed) preallocated buffer; no stacking copy
+            all_depth_data = self.depths
             target_depth_filename = episode_dir / COMPLETED_DEPTH_FILENAME
-        # Now zip and save this depth data.
-        depth_array = all_depth_data
-        depth_bytes = liblzfse.compress(depth_array.astype(np.float32).tobytes())
-        target_depth_filename.write_bytes(depth_bytes)
-
-        # TODO: remove debug code
-        # This should be 192 x 256 x 4 bytes = 196608 bytes per image
-        # buffer = np.frombuffer(
-        #        liblzfse.decompress(target_depth_filename.read_bytes()), dtype=np.float32
-        #   )
+        # Now compress and save this depth data. LZ4 at its fast level keeps up with the
+        # camera streams at hundreds of MB/s where lzfse was the bottleneck of write().
+        # Compression streams through the buffer a few MB at a time, so no full-size copy of
+        # the depth stack is ever materialized - the memmapped buffer goes straight from the
+        # page cache into the compressor.
+        if len(all_depth_data) == 0:
+            logging.error(f"No depth frames recorded for {episode_dir}")
+            return
+        n_per_chunk = max(1, (4 * 1024 * 1024) // all_depth_data[0].nbytes)
+        with open(target_depth_filename, "wb") as f, lz4.frame.LZ4FrameCompressor() as compressor:
+            f.write(compressor.begin())
+            for i in range(0, len(all_depth_data), n_per_chunk):
+                chunk = all_depth_data[i : i + n_per_chunk]
+                if chunk.dtype != np.uint16:
+                    # Depth arrives as float32 meters; the sensor only ever produced 16-bit
+                    # millimeters, so storing uint16 halves the payload without losing
+                    # anything. DEPTH_UNIT is written to configs.json to recover meters.
+                    chunk = np.round(chunk / DEPTH_UNIT).astype(np.uint16)
+                f.write(compressor.compress(np.ascontiguousarray(chunk).tobytes()))
+            f.write(compressor.flush())
@@ -13,6 +13,7 @@
 # LICENSE file in the root directory of this source tree.
 
 from ._base import (
+    mul4,
     normalize_ang_error,
     point_global_to_base,
     pose_global_to_base_xyt,
@@ -15,6 +15,7 @@ from typing import Iterable, Tuple
 
 import numpy as np
 import sophuspy as sp
+from numba import njit
 from scipy.spatial.transform import Rotation
 
 from stretch.core.interfaces import Pose
@@ -24,18 +25,56 @@ def normalize_ang_error(ang):
     return (ang + np.pi) % (2 * np.pi) - np.pi
 
 
+@njit(cache=True, fastmath=True)
+def _point_global_to_base(XYZ, current_pose):
+    # Planar SE(3) inverse applied to one point: rotate the offset from the base by -theta.
+    dx = XYZ[0] - current_pose[0]
+    dy = XYZ[1] - current_pose[1]
+    c = np.cos(current_pose[2])
+    s = np.sin(current_pose[2])
+    out = np.empty(3)
+    out[0] = c * dx + s * dy
+    out[1] = -s * dx + c * dy
+    out[2] = XYZ[2]
+    return out
+
+
+@njit(cache=True)
+def mul4(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """Multiply two 4x4 matrices. For pose composition on per-frame paths this beats
+    numpy's matmul, whose dispatch overhead dwarfs the 64 multiplies at this size.
+
+    Args:
+        A: 4x4 matrix
+        B: 4x4 matrix
+
+    Returns:
+        np.ndarray: 4x4 product A @ B
+    """
+    out = np.empty((4, 4))
+    for i in range(4):
+        for j in range(4):
+            s = 0.0
+            for k in range(4):
+                s += A[i, k] * B[k, j]
+            out[i, j] = s
+    return out
+
+
 def point_global_to_base(XYZ, current_pose):
     """
-    Transforms the point cloud into geocentric frame to account for
-    camera position
+    Transforms a point into the base frame to account for the robot's position.
+    This sits on the grasp/servo hot path, so the math is done in a numba kernel
+    instead of going through sophus pose objects.
     Input:
-        XYZ                     : ...x3
+        XYZ                     : (3,) point in the global frame
         current_pose            : base position (x, y, theta (radians))
     Output:
-        XYZ : ...x3
+        XYZ : (3,) point in the base frame
     """
-    pose_world2target = xyt2sophus(current_pose)
-    return (pose_world2target.inverse() * xyz2sophus(XYZ)).translation()
+    XYZ = np.ascontiguousarray(XYZ, dtype=np.float64)
+    current_pose = np.ascontiguousarray(current_pose, dtype=np.float64)
+    return _point_global_to_base(XYZ, current_pose)
 
 
 def xyt_global_to_base(XYT, current_pose):
@@ -13,13 +13,14 @@
 # LICENSE file in the root directory of this source tree.
 import copy
 import functools
-from typing import List
+from typing import List, Optional
 
 import cv2
 import numpy as np
 import torch
 import torch.nn.functional as F
 import trimesh.transformations as tra
+from numba import njit, prange
 from torch import Tensor
 
 
@@ -497,21 +498,69 @@ def adjust_intrinsics_matrix(K, old_size, new_size):
     return K_new
 
 
-def adjust_gamma(image: np.ndarray, gamma: float = 1.0):
-    """Build a lookup table mapping the pixel values [0, 255] to their adjusted gamma values. Gamma correction is used to adjust the brightness of an image. Gamma = 1.0 has no effect, gamma < 1.0 darkens the image, and gamma > 1.0 brightens the image.
+@functools.lru_cache(maxsize=None)
+def _gamma_lut(gamma: float) -> np.ndarray:
+    """Lookup table mapping pixel values [0, 255] to their gamma-adjusted values."""
+    invGamma = 1.0 / gamma
+    return np.array([((i / 255.0) ** invGamma) * 255 for i in np.arange(0, 256)]).astype("uint8")
+
+
+@njit(parallel=True, cache=True)
+def _apply_lut_inplace(img, lut):  # pragma: no cover - compiled
+    flat = img.ravel()
+    for i in prange(flat.size):
+        flat[i] = lut[flat[i]]
+
+
+def adjust_gamma(image: np.ndarray, gamma: float = 1.0, in_place: bool = False):
+    """Apply gamma correction to a uint8 image via a cached lookup table. Gamma correction is used to adjust the brightness of an image. Gamma = 1.0 has no effect, gamma < 1.0 darkens the image, and gamma > 1.0 brightens the image.
 
     Args:
         image (numpy.ndarray): The image to adjust.
         gamma (float): The gamma value to apply to the image.
+        in_place (bool): Rewrite the pixels of the input image instead of allocating a new
+            array; only for images the caller owns (e.g. freshly captured frames).
     """
-
-    invGamma = 1.0 / gamma
-    table = np.array([((i / 255.0) ** invGamma) * 255 for i in np.arange(0, 256)]).astype("uint8")
+    table = _gamma_lut(gamma)
+    if in_place and image.dtype == np.uint8 and image.flags["C_CONTIGUOUS"]:
+        _apply_lut_inplace(image, table)
+        return image
 
     # apply gamma correction using the lookup table
     return cv2.LUT(image, table)
 
 
+@njit(parallel=True, fastmath=True, cache=True)
+def _depth_to_u16(src, dst):  # pragma: no cover - compiled
+    s = src.ravel()
+    d = dst.ravel()
+    for i in prange(s.size):
+        d[i] = np.uint16(s[i] * 1000.0)
+
+
+def depth_to_u16(depth: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Convert a float depth image in meters to uint16 millimeters.
+
+    Fuses the multiply and cast of ``(depth * 1000).astype(np.uint16)`` into one pass, so no
+    full-size float temporary is allocated; this step is memory bound, and halving the bytes
+    written roughly doubles its throughput on a 1-2 MP depth image.
+
+    Args:
+        depth (numpy.ndarray): Float depth image in meters; returned as-is if already uint16.
+        out (numpy.ndarray): Optional preallocated uint16 buffer to write into, reused across
+            frames by hot loops.
+
+    Returns:
+        numpy.ndarray: The depth image as uint16 millimeters.
+    """
+    if depth.dtype == np.uint16:
+        return depth
+    if out is None or out.shape != depth.shape:
+        out = np.empty(depth.shape, dtype=np.uint16)
+    _depth_to_u16(np.ascontiguousarray(depth), out)
+    return out
+
+
 def autoAdjustments_with_convertScaleAbs(img):
     # Initial code copied from
     # https://answers.opencv.org/question/75510/how-to-make-auto-adjustmentsbrightness-and-contrast-for-image-android-opencv-image-correction/
@@ -8,10 +8,18 @@
 # license information maybe found below, if so.
 
 import os
+from typing import Optional
 
 path = os.path.expanduser("~/.stretch")
 
 
+def local_ipc_address(port: int) -> str:
+    """Unix-socket endpoint used when server and client share a host, keyed by the channel's
+    port number so existing port-based configuration keeps mapping to unique channels. Must
+    match on both sides; the comms nodes and the ZMQ client both derive from here."""
+    return f"ipc:///tmp/stretch_zmq_{port}"
+
+
 def _ensure_path_exists() -> None:
     """Ensure that the ~/.stretch directory exists."""
 
@@ -19,13 +27,20 @@ def _ensure_path_exists() -> None:
         os.makedirs(path)
 
 
-def lookup_address(robot_ip: str, use_remote_computer: bool = False, update: bool = True) -> str:
+def lookup_address(
+    robot_ip: str,
+    use_remote_computer: bool = False,
+    update: bool = True,
+    port: Optional[int] = None,
+) -> str:
     """Return the address of the robot. Will also create and update ~/.stretch/robot_ip.txt file to manage robot IP address.
 
     Args
         robot_ip: IP address of the robot
         use_remote_computer: Use remote computer or not
         update: Update the robot IP address file
+        port: Channel port; when given, the full endpoint is returned, and the local case
+            uses the ipc:// transport the servers bind in local mode instead of loopback TCP
     """
     # Use remote computer or whatever
     _ensure_path_exists()
@@ -39,7 +54,11 @@ def lookup_address(robot_ip: str, use_remote_computer: bool = False, update: boo
             # Look up the robot computer in config directory
             robot_ip = open(os.path.expanduser("~/.stretch/robot_ip.txt")).read().strip()
         recv_address = "tcp://" + robot_ip
+        if port is not None:
+            recv_address += ":" + str(port)
     else:
+        if port is not None:
+            return local_ipc_address(port)
         recv_address = "tcp://127.0.0.1"
     return recv_address
 
@@ -0,0 +1,51 @@
+# Copyright (c) Hello Robot, Inc.
+# All rights reserved.
+#
+# This source code is licensed under the license found in the LICENSE file in the root directory
+# of this source tree.
+#
+# Some code may be adapted from other open-source works with their respective licenses. Original
+# license information maybe found below, if so.
+
+from typing import Any
+
+import msgpack
+import numpy as np
+
+
+def _encode_hook(obj: Any) -> Any:
+    """Encode types msgpack does not know about, most importantly numpy arrays."""
+    if isinstance(obj, np.ndarray):
+        return {
+            "__ndarray__": True,
+            "dtype": str(obj.dtype),
+            "shape": obj.shape,
+            "data": obj.tobytes(),
+        }
+    if isinstance(obj, (np.floating, np.integer, np.bool_)):
+        return obj.item()
+    # Last resort for opaque objects like pyrealsense2 enums (e.g. the distortion model in
+    # camera info dicts); these are only ever displayed, never computed with.
+    return str(obj)
+
+
+def _decode_hook(obj: dict) -> Any:
+    """Reconstruct numpy arrays encoded by _encode_hook."""
+    if "__ndarray__" in obj:
+        # Copy into a bytearray so the result is writable: frombuffer over the msgpack
+        # bytes would return a read-only view, and consumers (e.g. the grasp operations)
+        # mutate joint arrays they pull out of these messages.
+        return np.frombuffer(bytearray(obj["data"]), dtype=obj["dtype"]).reshape(obj["shape"])
+    return obj
+
+
+def pack(obj: Any) -> bytes:
+    """Serialize a message dict to msgpack bytes. Much faster than pickle for the small
+    dicts and image buffers we send over ZMQ, and it does not execute arbitrary code on
+    the receiving side."""
+    return msgpack.packb(obj, default=_encode_hook, use_bin_type=True)
+
+
+def unpack(data: bytes) -> Any:
+    """Deserialize a message packed with pack()."""
+    return msgpack.unpackb(data, object_hook=_decode_hook, raw=False)
@@ -9,7 +9,9 @@
 # Some code may be adapted from other open-source works with their respective licenses. Original
 # license information maybe found below, if so.
 
+import hashlib
 import importlib.resources as importlib_resources
+import os
 import re
 import timeit
 
@@ -27,27 +29,35 @@ urdf_dir = pkg_path + f"/{model_name}/"
 
 def get_absolute_path_stretch_urdf(urdf_file_path, mesh_files_directory_path) -> str:
     """
-    Generates Robot URDF with absolute path to mesh files
+    Generates Robot URDF with absolute path to mesh files.
+
+    This runs at import time, so the rewritten URDF is cached on disk: the output file is
+    keyed on the input paths and only rewritten when its content actually changed.
     """
 
     with open(urdf_file_path, "r") as f:
         _urdf_file = f.read()
 
-    # find all the line which has the pattrn {file="something.type"}
-    # and replace the file path with the absolute path
-    pattern = r'filename="(.+?)"'
-    for match in re.finditer(pattern, _urdf_file):
-        orig = match.group(1)
-        fn = match.group(1).split("/")[-1]
-        file_path = mesh_files_directory_path + "/" + fn
-        _urdf_file = _urdf_file.replace(orig, file_path)
+    # Point every filename="..." attribute at the absolute mesh directory in a single pass
+    _urdf_file = re.sub(
+        r'filename="([^"]+)"',
+        lambda m: f'filename="{mesh_files_directory_path}/{os.path.basename(m.group(1))}"',
+        _urdf_file,
+    )
 
     # Absosolute path converted streth xml
-    temp_abs_urdf = "stretch_temp_abs.urdf"
-    with open(urdf_dir + temp_abs_urdf, "w") as f:
+    key = hashlib.blake2b(
+        f"{urdf_file_path}|{mesh_files_directory_path}".encode(), digest_size=8
+    ).hexdigest()
+    temp_abs_urdf = urdf_dir + f"stretch_temp_abs_{key}.urdf"
+    if os.path.exists(temp_abs_urdf):
+        with open(temp_abs_urdf, "r") as f:
+            if f.read() == _urdf_file:
+                return temp_abs_urdf
+    with open(temp_abs_urdf, "w") as f:
         f.write(_urdf_file)
-    print("Saving temp abs path stretch urdf: {}".format(urdf_dir + f"{temp_abs_urdf}"))
-    return urdf_dir + temp_abs_urdf
+    print("Saving temp abs path stretch urdf: {}".format(temp_abs_urdf))
+    return temp_abs_urdf
 
 
 class URDFVisualizer:
@@ -62,13 +72,21 @@ class URDFVisualizer:
         self.urdf = urdf_loader.URDF.load(urdf_file)
 
     def get_tri_meshes(
-        self, cfg: dict = None, use_collision: bool = True, debug: bool = False
+        self,
+        cfg: dict = None,
+        use_collision: bool = True,
+        debug: bool = False,
+        copy_meshes: bool = False,
     ) -> list:
         """
         Get list of trimesh objects, pose and link names of the robot with the given configuration
         Args:
             cfg: Configuration of the robot
             use_collision: Whether to use collision meshes or visual meshes
+            copy_meshes: Copy each mesh before returning it. The link geometry is static -
+                only the poses depend on cfg - so callers that just read vertices or poses
+                should leave this off and skip a full vertex duplication per call. Only set it
+                if you intend to mutate the returned meshes.
         Returns:
             list: List of trimesh objects, pose and link names of the robot with the given configuration
         """
@@ -81,7 +99,7 @@ class URDFVisualizer:
         t_meshes = {"mesh": [], "pose": [], "link": []}
         for tm in fk:
             pose = fk[tm]
-            t_mesh = tm.copy()
+            t_mesh = tm.copy() if copy_meshes else tm
             t_meshes["mesh"].append(t_mesh)
             t_meshes["pose"].append(pose)
             # [:-4] to remove the .STL extension
@@ -105,11 +123,19 @@ class URDFVisualizer:
         """
         tm = self.get_tri_meshes(cfg, use_collision)
         mesh_list = tm["mesh"]
-        pose_list = np.array(tm["pose"])
-        for m, p in zip(mesh_list, pose_list):
-            m.apply_transform(p)
-        combined_mesh = np.sum(mesh_list)
-        combined_mesh.remove_duplicate_faces()
+        pose_list = tm["pose"]
+        # Transform vertices arithmetically and concatenate everything in one pass.
+        # Summing trimesh objects rebuilds the combined mesh link by link (quadratic in the
+        # number of links, with processing/dedup each time); a flat concatenation with offset
+        # faces is linear and leaves the shared base meshes untouched.
+        v_list = [m.vertices @ p[:3, :3].T + p[:3, 3] for m, p in zip(mesh_list, pose_list)]
+        offsets = np.cumsum([0] + [len(v) for v in v_list[:-1]])
+        f_list = [m.faces + offset for m, offset in zip(mesh_list, offsets)]
+        combined_mesh = Trimesh(
+            vertices=np.concatenate(v_list, axis=0),
+            faces=np.concatenate(f_list, axis=0),
+            process=False,
+        )
         return combined_mesh
 
     def get_transform(self, cfg: dict, link_name: str) -> np.ndarray:
@@ -20,7 +20,7 @@ from overrides import override
 import stretch.utils.compression as compression
 import stretch.utils.logger as logger
 from stretch.core.server import BaseZmqServer
-from stretch.utils.image import adjust_gamma, scale_camera_matrix
+from stretch.utils.image import adjust_gamma, depth_to_u16, scale_camera_matrix
 from stretch_ros2_bridge.remote import StretchClient
 from stretch_ros2_bridge.ros.map_saver import MapSerializerDeserializer
 
@@ -36,6 +36,36 @@ class ZmqServer(BaseZmqServer):
         # Map saver - write and load map information from SLAM
         self.map_saver = MapSerializerDeserializer()
 
+        # Camera intrinsics are static, but converting/scaling them per message costs a
+        # GPU->CPU sync (camera_K lives on the torch device) plus allocations in the hot
+        # send loops; cache the converted matrices on first use.
+        self._cached_camera_K = None
+        self._cached_servo_Ks = None
+
+        # Persistent fast-state message, refilled by assignment each tick instead of building
+        # a fresh dict at the fast spin rate. Safe to reuse only because spin_send_state packs
+        # the message in the same thread before the next tick touches it; the observation and
+        # servo messages must NOT share this trick since they are packed on a different thread
+        # than the one producing the next frame.
+        self._state_message: Dict[str, Any] = {}
+
+        # Dispatch table for handle_action: one membership probe per candidate key instead of
+        # re-testing the whole chain on every message. Order matters - it preserves the
+        # priority of the old if/elif chain (e.g. a message carrying both "joint" and
+        # "gripper" is an arm command which also sets the gripper).
+        self._action_handlers = (
+            ("posture", self._handle_posture),
+            ("control_mode", self._handle_control_mode),
+            ("save_map", self._handle_save_map),
+            ("load_map", self._handle_load_map),
+            ("say", self._handle_say),
+            ("xyt", self._handle_xyt),
+            ("base_velocity", self._handle_base_velocity),
+            ("joint", self._handle_joint),
+            ("head_to", self._handle_head_to),
+            ("gripper", self._handle_gripper),
+        )
+
     @override
     def is_running(self) -> bool:
         return self.is_running and rclpy.ok()
@@ -63,19 +93,24 @@ class ZmqServer(BaseZmqServer):
         rgb, depth = obs.rgb, obs.depth
         width, height = rgb.shape[:2]
 
+        if self._cached_camera_K is None:
+            self._cached_camera_K = obs.camera_K.cpu().numpy()
+
         # Convert depth into int format
-        depth = (depth * 1000).astype(np.uint16)
+        depth = depth_to_u16(depth)
+        depth_shape = depth.shape
 
-        # Make both into jpegs
+        # Compress both for the wire
         rgb = compression.to_jpg(rgb)
-        depth = compression.to_jp2(depth)
+        depth = compression.to_depth(depth)
 
         # Get the other fields from an observation
         # rgb = compression.to_webp(rgb)
         data = {
             "rgb": rgb,
             "depth": depth,
-            "camera_K": obs.camera_K.cpu().numpy(),
+            "depth/shape": depth_shape,
+            "camera_K": self._cached_camera_K,
             "camera_pose": obs.camera_pose,
             "ee_pose": self.client.ee_pose,
             "joint": obs.joint,
@@ -95,182 +130,198 @@ class ZmqServer(BaseZmqServer):
     def get_state_message(self) -> Dict[str, Any]:
         """Get the state message for the robot."""
         q, dq, eff = self.client.get_joint_state()
-        message = {
-            "base_pose": self.client.get_base_pose(),
-            "ee_pose": self.client.ee_pose,
-            "joint_positions": q,
-            "joint_velocities": dq,
-            "joint_efforts": eff,
-            "control_mode": self.get_control_mode(),
-            "at_goal": self.client.at_goal(),
-            "is_homed": self.client.is_homed,
-            "is_runstopped": self.client.is_runstopped,
-        }
+        message = self._state_message
+        message["base_pose"] = self.client.get_base_pose()
+        message["ee_pose"] = self.client.ee_pose
+        message["joint_positions"] = q
+        message["joint_velocities"] = dq
+        message["joint_efforts"] = eff
+        message["control_mode"] = self.get_control_mode()
+        message["at_goal"] = self.client.at_goal()
+        message["is_homed"] = self.client.is_homed
+        message["is_runstopped"] = self.client.is_runstopped
         return message
 
     @override
     def handle_action(self, action: Dict[str, Any]):
         """Handle an action from the client."""
-        if "posture" in action:
-            if action["posture"] == "manipulation":
-                self.client.switch_to_busy_mode()
-                self.client.move_to_manip_posture()
-                self.client.switch_to_manipulation_mode()
-            elif action["posture"] == "navigation":
-                self.client.switch_to_busy_mode()
-                self.client.move_to_nav_posture()
-                self.client.switch_to_navigation_mode()
-            else:
-                print(
-                    " - posture",
-                    action["posture"],
-                    "not recognized or supported.",
-                )
-        elif "control_mode" in action:
-            if action["control_mode"] == "manipulation":
-                self.client.switch_to_manipulation_mode()
-                self.control_mode = "manipulation"
-            elif action["control_mode"] == "navigation":
-                self.client.switch_to_navigation_mode()
-                self.control_mode = "navigation"
-            else:
-                print(
-                    " - control mode",
-                    action["control_mode"],
-                    "not recognized or supported.",
-                )
-        elif "save_map" in action:
-            self.client.save_map(action["save_map"])
-        elif "load_map" in action:
-            self.client.load_map(action["load_map"])
-        elif "say" in action:
-            # Text to speech from the robot, not the client/agent device
-            self.text_to_speech.say_async(action["say"])
-        elif "xyt" in action:
-            if self.verbose:
-                print(
-                    "Is robot in navigation mode?",
-                    self.client.in_navigation_mode(),
-                )
-                print(f"{action['xyt']} {action['nav_relative']} {action['nav_blocking']}")
-            self.client.navigate_to(
-                action["xyt"],
-                relative=action["nav_relative"],
+        for key, handler in self._action_handlers:
+            if key in action:
+                handler(action)
+                return
+        logger.warning(" - action not recognized or supported.")
+        logger.warning(action)
+
+    def _handle_posture(self, action: Dict[str, Any]):
+        if action["posture"] == "manipulation":
+            self.client.switch_to_busy_mode()
+            self.client.move_to_manip_posture()
+            self.client.switch_to_manipulation_mode()
+        elif action["posture"] == "navigation":
+            self.client.switch_to_busy_mode()
+            self.client.move_to_nav_posture()
+            self.client.switch_to_navigation_mode()
+        else:
+            print(
+                " - posture",
+                action["posture"],
+                "not recognized or supported.",
+            )
+
+    def _handle_control_mode(self, action: Dict[str, Any]):
+        if action["control_mode"] == "manipulation":
+            self.client.switch_to_manipulation_mode()
+            self.control_mode = "manipulation"
+        elif action["control_mode"] == "navigation":
+            self.client.switch_to_navigation_mode()
+            self.control_mode = "navigation"
+        else:
+            print(
+                " - control mode",
+                action["control_mode"],
+                "not recognized or supported.",
             )
-        elif "base_velocity" in action:
-            base_velocity_action = action["base_velocity"]
-            if self.verbose:
-                print(
-                    f"Setting base velocity to translation={base_velocity_action['v']} and rotation={base_velocity_action['w']}"
-                )
-            if "v" in base_velocity_action:
-                v = base_velocity_action["v"]
-            if "w" in base_velocity_action:
-                w = action["base_velocity"]["w"]
-            self.client.nav.set_velocity(v, w)
-        elif "joint" in action:
-            # This allows for executing motor commands on the robot relatively quickly
-            if self.verbose:
-                print(f"Moving arm to config={action['joint']}")
-            if "gripper" in action:
-                gripper_cmd = action["gripper"]
-            else:
-                gripper_cmd = None
-            if "head_to" in action:
-                head_pan_cmd, head_tilt_cmd = action["head_to"]
-            else:
-                head_pan_cmd, head_tilt_cmd = None, None
-            # Now send all command fields here
-            self.client.arm_to(
-                action["joint"],
-                gripper=gripper_cmd,
-                head_pan=head_pan_cmd,
-                head_tilt=head_tilt_cmd,
-                blocking=False,
+
+    def _handle_save_map(self, action: Dict[str, Any]):
+        self.client.save_map(action["save_map"])
+
+    def _handle_load_map(self, action: Dict[str, Any]):
+        self.client.load_map(action["load_map"])
+
+    def _handle_say(self, action: Dict[str, Any]):
+        # Text to speech from the robot, not the client/agent device
+        self.text_to_speech.say_async(action["say"])
+
+    def _handle_xyt(self, action: Dict[str, Any]):
+        if self.verbose:
+            print(
+                "Is robot in navigation mode?",
+                self.client.in_navigation_mode(),
             )
-        elif "head_to" in action:
-            # This will send head without anything else
-            if self.verbose or True:
-                print(f"Moving head to {action['head_to']}")
-            self.client.head_to(
-                action["head_to"][0],
-                action["head_to"][1],
-                blocking=False,
+            print(f"{action['xyt']} {action['nav_relative']} {action['nav_blocking']}")
+        self.client.navigate_to(
+            action["xyt"],
+            relative=action["nav_relative"],
+        )
+
+    def _handle_base_velocity(self, action: Dict[str, Any]):
+        base_velocity_action = action["base_velocity"]
+        if self.verbose:
+            print(
+                f"Setting base velocity to translation={base_velocity_action['v']} and rotation={base_velocity_action['w']}"
             )
-        elif "gripper" in action and "joint" not in action:
-            if self.verbose or True:
-                print(f"Moving gripper to {action['gripper']}")
-            self.client.manip.move_gripper(action["gripper"])
+        if "v" in base_velocity_action:
+            v = base_velocity_action["v"]
+        if "w" in base_velocity_action:
+            w = action["base_velocity"]["w"]
+        self.client.nav.set_velocity(v, w)
+
+    def _handle_joint(self, action: Dict[str, Any]):
+        # This allows for executing motor commands on the robot relatively quickly
+        if self.verbose:
+            print(f"Moving arm to config={action['joint']}")
+        if "gripper" in action:
+            gripper_cmd = action["gripper"]
+        else:
+            gripper_cmd = None
+        if "head_to" in action:
+            head_pan_cmd, head_tilt_cmd = action["head_to"]
         else:
-            logger.warning(" - action not recognized or supported.")
-            logger.warning(action)
+            head_pan_cmd, head_tilt_cmd = None, None
+        # Now send all command fields here
+        self.client.arm_to(
+            action["joint"],
+            gripper=gripper_cmd,
+            head_pan=head_pan_cmd,
+            head_tilt=head_tilt_cmd,
+            blocking=False,
+        )
+
+    def _handle_head_to(self, action: Dict[str, Any]):
+        # This will send head without anything else
+        if self.verbose or True:
+            print(f"Moving head to {action['head_to']}")
+        self.client.head_to(
+            action["head_to"][0],
+            action["head_to"][1],
+            blocking=False,
+        )
+
+    def _handle_gripper(self, action: Dict[str, Any]):
+        if self.verbose or True:
+            print(f"Moving gripper to {action['gripper']}")
+        self.client.manip.move_gripper(action["gripper"])
 
-    def _get_ee_cam_message(self) -> Dict[str, Any]:
-        # Read images from the end effector and head cameras
+    def _get_ee_images(self) -> tuple:
+        """Read, rescale and gamma-correct the end effector camera images."""
         ee_depth_image = self.client.ee_dpt_cam.get()
         ee_color_image = self.client.ee_rgb_cam.get()
         ee_color_image, ee_depth_image = self._rescale_color_and_depth(
-            ee_color_image, ee_depth_image, self.ee_image_scaling
+            ee_color_image, ee_depth_image, self.ee_image_scaling, tag="ee_cam"
         )
 
         # Adapt color so we can use higher shutter speed
-        ee_color_image = adjust_gamma(ee_color_image, 2.5)
+        ee_color_image = adjust_gamma(ee_color_image, 2.5, in_place=True)
 
         # Conversion
-        ee_depth_image = (ee_depth_image * 1000).astype(np.uint16)
-
-        # Compress the images
-        compressed_ee_depth_image = compression.to_jp2(ee_depth_image)
-        compressed_ee_color_image = compression.to_jpg(ee_color_image)
-
-        ee_camera_pose = self.client.ee_camera_pose
-
-        d405_output = {
-            "ee_cam/color_camera_K": scale_camera_matrix(
-                self.client.ee_rgb_cam.get_K(), self.ee_image_scaling
-            ),
-            "ee_cam/depth_camera_K": scale_camera_matrix(
-                self.client.ee_dpt_cam.get_K(), self.ee_image_scaling
-            ),
-            "ee_cam/color_image": compressed_ee_color_image,
-            "ee_cam/depth_image": compressed_ee_depth_image,
-            "ee_cam/color_image/shape": ee_color_image.shape,
-            "ee_cam/depth_image/shape": ee_depth_image.shape,
-            "ee_cam/image_scaling": self.ee_image_scaling,
-            "ee_cam/depth_scaling": self.ee_depth_scaling,
-            "ee_cam/pose": ee_camera_pose,
-        }
-        return d405_output
+        ee_depth_image = depth_to_u16(ee_depth_image)
+        return ee_color_image, ee_depth_image
 
     def get_servo_message(self) -> Dict[str, Any]:
-        d405_output = self._get_ee_cam_message()
+        ee_color_image, ee_depth_image = self._get_ee_images()
 
         obs = self.client.get_observation(compute_xyz=False)
         head_color_image, head_depth_image = self._rescale_color_and_depth(
-            obs.rgb, obs.depth, self.image_scaling
+            obs.rgb, obs.depth, self.image_scaling, tag="head_cam"
+        )
+        head_depth_image = depth_to_u16(head_depth_image)
+
+        if self._cached_servo_Ks is None:
+            self._cached_servo_Ks = {
+                "head_cam/color_camera_K": scale_camera_matrix(
+                    self.client.rgb_cam.get_K(), self.image_scaling
+                ),
+                "head_cam/depth_camera_K": scale_camera_matrix(
+                    self.client.dpt_cam.get_K(), self.image_scaling
+                ),
+                "ee_cam/color_camera_K": scale_camera_matrix(
+                    self.client.ee_rgb_cam.get_K(), self.ee_image_scaling
+                ),
+                "ee_cam/depth_camera_K": scale_camera_matrix(
+                    self.client.ee_dpt_cam.get_K(), self.ee_image_scaling
+                ),
+            }
+
+        # The jpeg/jp2 encoders release the GIL, so compress all four images in parallel on
+        # the server's persistent pool instead of paying for them back to back.
+        compressed_ee_color_image = self._encode_pool.submit(compression.to_jpg, ee_color_image)
+        compressed_ee_depth_image = self._encode_pool.submit(compression.to_depth, ee_depth_image)
+        compressed_head_color_image = self._encode_pool.submit(
+            compression.to_jpg, head_color_image
+        )
+        compressed_head_depth_image = self._encode_pool.submit(
+            compression.to_depth, head_depth_image
         )
-        head_depth_image = (head_depth_image * 1000).astype(np.uint16)
-        compressed_head_depth_image = compression.to_jp2(head_depth_image)
-        compressed_head_color_image = compression.to_jpg(head_color_image)
 
         message = {
             "ee/pose": self.client.ee_pose,
-            "head_cam/color_camera_K": scale_camera_matrix(
-                self.client.rgb_cam.get_K(), self.image_scaling
-            ),
-            "head_cam/depth_camera_K": scale_camera_matrix(
-                self.client.dpt_cam.get_K(), self.image_scaling
-            ),
-            "head_cam/color_image": compressed_head_color_image,
-            "head_cam/depth_image": compressed_head_depth_image,
+            "head_cam/color_image": compressed_head_color_image.result(),
+            "head_cam/depth_image": compressed_head_depth_image.result(),
             "head_cam/color_image/shape": head_color_image.shape,
             "head_cam/depth_image/shape": head_depth_image.shape,
             "head_cam/image_scaling": self.image_scaling,
             "head_cam/depth_scaling": self.depth_scaling,
             "head_cam/pose": self.client.head_camera_pose,
             "robot/config": obs.joint,
+            "ee_cam/color_image": compressed_ee_color_image.result(),
+            "ee_cam/depth_image": compressed_ee_depth_image.result(),
+            "ee_cam/color_image/shape": ee_color_image.shape,
+            "ee_cam/depth_image/shape": ee_depth_image.shape,
+            "ee_cam/image_scaling": self.ee_image_scaling,
+            "ee_cam/depth_scaling": self.ee_depth_scaling,
+            "ee_cam/pose": self.client.ee_camera_pose,
         }
-        message.update(d405_output)
+        message.update(self._cached_servo_Ks)
         return message
 
 
@@ -0,0 +1,59 @@
+# Copyright (c) Hello Robot, Inc.
+# All rights reserved.
+#
+# This source code is licensed under the license found in the LICENSE file in the root directory
+# of this source tree.
+#
+# Some code may be adapted from other open-source works with their respective licenses. Original
+# license information maybe found below, if so.
+
+import numpy as np
+
+from stretch.utils.compression import from_depth, to_depth
+
+
+def test_depth_round_trip():
+    """to_depth/from_depth is the lossless wire format for uint16 depth images."""
+    depth = np.random.randint(0, 5000, size=(240, 320), dtype=np.uint16)
+
+    output = from_depth(to_depth(depth), depth.shape)
+
+    assert output.dtype == np.uint16
+    assert output.shape == depth.shape
+    assert np.array_equal(output, depth)
+
+
+def test_depth_round_trip_non_contiguous():
+    """Sliced (non-contiguous) inputs are made contiguous before compression."""
+    full = np.random.randint(0, 5000, size=(240, 320), dtype=np.uint16)
+    depth = full[::2, ::2]
+
+    output = from_depth(to_depth(depth), depth.shape)
+
+    assert np.array_equal(output, depth)
+
+
+def test_depth_accepts_wider_integers():
+    """to_depth casts to uint16 on the way in, matching the wire contract."""
+    depth = np.random.randint(0, 5000, size=(60, 80)).astype(np.int64)
+
+    output = from_depth(to_depth(depth), depth.shape)
+
+    assert output.dtype == np.uint16
+    assert np.array_equal(output, depth.astype(np.uint16))
+
+
+def test_depth_compresses_runs():
+    """Flat regions (common in depth maps) should compress well below raw size."""
+    depth = np.full((480, 640), 1234, dtype=np.uint16)
+
+    compressed = to_depth(depth)
+
+    assert len(compressed) < depth.nbytes // 10
+
+
+if __name__ == "__main__":
+    test_depth_round_trip()
+    test_depth_round_trip_non_contiguous()
+    test_depth_accepts_wider_integers()
+    test_depth_compresses_runs()
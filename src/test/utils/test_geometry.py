@@ -0,0 +1,68 @@
+# Copyright (c) Hello Robot, Inc.
+# All rights reserved.
+#
+# This source code is licensed under the license found in the LICENSE file in the root directory
+# of this source tree.
+#
+# Some code may be adapted from other open-source works with their respective licenses. Original
+# license information maybe found below, if so.
+
+import numpy as np
+
+from stretch.utils.geometry import mul4, point_global_to_base
+
+
+def _point_global_to_base_reference(xyz, pose):
+    """Plain-numpy SE(2) inverse transform, the math the numba kernel replaced."""
+    x, y, theta = pose
+    rotation = np.array(
+        [[np.cos(theta), -np.sin(theta)], [np.sin(theta), np.cos(theta)]],
+    )
+    out = np.empty(3)
+    out[:2] = rotation.T @ (np.asarray(xyz[:2], dtype=np.float64) - np.array([x, y]))
+    out[2] = xyz[2]
+    return out
+
+
+def test_point_global_to_base_matches_reference():
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        xyz = rng.uniform(-5.0, 5.0, size=3)
+        pose = np.array([*rng.uniform(-5.0, 5.0, size=2), rng.uniform(-np.pi, np.pi)])
+        output = point_global_to_base(xyz, pose)
+        assert np.allclose(output, _point_global_to_base_reference(xyz, pose))
+
+
+def test_point_global_to_base_identity():
+    """With the base at the origin and no rotation, the point is unchanged."""
+    xyz = np.array([1.0, 2.0, 3.0])
+    assert np.allclose(point_global_to_base(xyz, np.zeros(3)), xyz)
+
+
+def test_point_global_to_base_accepts_lists():
+    output = point_global_to_base([1.0, 0.0, 0.5], [0.0, 0.0, np.pi / 2])
+    assert np.allclose(output, [0.0, -1.0, 0.5])
+
+
+def test_mul4_matches_matmul():
+    rng = np.random.default_rng(1)
+    for _ in range(20):
+        A = rng.standard_normal((4, 4))
+        B = rng.standard_normal((4, 4))
+        assert np.allclose(mul4(A, B), A @ B)
+
+
+def test_mul4_pose_composition():
+    """Composing a transform with identity leaves it unchanged."""
+    pose = np.eye(4)
+    pose[:3, 3] = [1.0, 2.0, 3.0]
+    assert np.allclose(mul4(pose, np.eye(4)), pose)
+    assert np.allclose(mul4(np.eye(4), pose), pose)
+
+
+if __name__ == "__main__":
+    test_point_global_to_base_matches_reference()
+    test_point_global_to_base_identity()
+    test_point_global_to_base_accepts_lists()
+    test_mul4_matches_matmul()
+    test_mul4_pose_composition()
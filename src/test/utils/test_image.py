@@ -0,0 +1,55 @@
+# Copyright (c) Hello Robot, Inc.
+# All rights reserved.
+#
+# This source code is licensed under the license found in the LICENSE file in the root directory
+# of this source tree.
+#
+# Some code may be adapted from other open-source works with their respective licenses. Original
+# license information maybe found below, if so.
+
+import numpy as np
+
+from stretch.utils.image import depth_to_u16
+
+
+def test_depth_to_u16_matches_reference():
+    """The fused kernel must agree with the (depth * 1000).astype(np.uint16) it replaced."""
+    depth = np.random.rand(120, 160).astype(np.float32) * 4.0
+
+    output = depth_to_u16(depth)
+
+    assert output.dtype == np.uint16
+    assert output.shape == depth.shape
+    assert np.array_equal(output, (depth * 1000).astype(np.uint16))
+
+
+def test_depth_to_u16_float64():
+    depth = np.random.rand(60, 80) * 4.0
+
+    output = depth_to_u16(depth)
+
+    assert np.array_equal(output, (depth * 1000).astype(np.uint16))
+
+
+def test_depth_to_u16_passthrough():
+    """Already-converted images come back as the same object, not a copy."""
+    depth = np.random.randint(0, 4000, size=(60, 80), dtype=np.uint16)
+
+    assert depth_to_u16(depth) is depth
+
+
+def test_depth_to_u16_reuses_out_buffer():
+    depth = np.random.rand(60, 80).astype(np.float32)
+    out = np.empty((60, 80), dtype=np.uint16)
+
+    output = depth_to_u16(depth, out=out)
+
+    assert output is out
+    assert np.array_equal(output, (depth * 1000).astype(np.uint16))
+
+
+if __name__ == "__main__":
+    test_depth_to_u16_matches_reference()
+    test_depth_to_u16_float64()
+    test_depth_to_u16_passthrough()
+    test_depth_to_u16_reuses_out_buffer()
@@ -0,0 +1,77 @@
+# Copyright (c) Hello Robot, Inc.
+# All rights reserved.
+#
+# This source code is licensed under the license found in the LICENSE file in the root directory
+# of this source tree.
+#
+# Some code may be adapted from other open-source works with their respective licenses. Original
+# license information maybe found below, if so.
+
+import numpy as np
+
+from stretch.utils.serialization import pack, unpack
+
+
+def test_round_trip_message():
+    """A message dict like the ZMQ servers send should survive pack/unpack unchanged."""
+    message = {
+        "rgb": b"\x00\x01\x02jpeg-ish-bytes",
+        "depth/shape": (480, 640),
+        "camera_K": np.array([[500.0, 0.0, 320.0], [0.0, 500.0, 240.0], [0.0, 0.0, 1.0]]),
+        "joint": np.random.rand(11),
+        "step": 42,
+        "at_goal": True,
+        "control_mode": "navigation",
+    }
+
+    output = unpack(pack(message))
+
+    assert output["rgb"] == message["rgb"]
+    assert tuple(output["depth/shape"]) == message["depth/shape"]
+    assert output["step"] == 42
+    assert output["at_goal"] is True
+    assert output["control_mode"] == "navigation"
+    for key in ("camera_K", "joint"):
+        assert output[key].dtype == message[key].dtype
+        assert output[key].shape == message[key].shape
+        assert np.array_equal(output[key], message[key])
+
+
+def test_round_trip_array_dtypes():
+    """Arrays of the dtypes we put on the wire keep dtype, shape and values."""
+    for array in (
+        np.random.rand(4, 4),
+        np.random.rand(3).astype(np.float32),
+        (np.random.rand(32, 48) * 4000).astype(np.uint16),
+        np.random.randint(0, 255, size=(8, 8, 3), dtype=np.uint8),
+        np.array([True, False, True]),
+    ):
+        output = unpack(pack({"data": array}))["data"]
+        assert output.dtype == array.dtype
+        assert output.shape == array.shape
+        assert np.array_equal(output, array)
+
+
+def test_unpacked_arrays_are_writable():
+    """Consumers mutate arrays from messages (e.g. grasp ops write the wrist pitch into a
+    cached joint state), so unpack must not hand out read-only views of the msgpack buffer."""
+    joint = np.random.rand(11)
+    output = unpack(pack({"joint": joint}))["joint"]
+
+    assert output.flags.writeable
+    output[0] = -1.0
+    assert output[0] == -1.0
+
+
+def test_numpy_scalars_become_python_scalars():
+    output = unpack(pack({"a": np.float32(1.5), "b": np.int64(3), "c": np.bool_(True)}))
+    assert output["a"] == 1.5
+    assert output["b"] == 3
+    assert output["c"] is True
+
+
+if __name__ == "__main__":
+    test_round_trip_message()
+    test_round_trip_array_dtypes()
+    test_unpacked_arrays_are_writable()
+    test_numpy_scalars_become_python_scalars()